@@ -303,11 +303,12 @@ def trigger_scan():
 
             from src.api.alpaca_client import AlpacaClient
             from src.api.market_data import MarketDataManager
-            from src.data.options_scanner import OptionsScanner
+            from src.data.options_scanner import OptionsScanner, PUT_SCAN_WORKERS
 
             alpaca_client = AlpacaClient(config)
             market_data = MarketDataManager(alpaca_client, config)
-            scanner = OptionsScanner(alpaca_client, market_data, config)
+            scanner = OptionsScanner(alpaca_client, market_data, config,
+                                     scan_workers=PUT_SCAN_WORKERS)
 
             # FC-065 Phase 4: mint the cycle identifier HERE, once. /scan and
             # /run are separate stateless requests ~15 minutes apart and
@@ -654,7 +655,7 @@ def trigger_strategy():
             # against available shares.
             ranked = exec_engine.rank_opportunities(
                 opportunities, put_seller, available_buying_power,
-                positions=positions_snapshot
+                positions=positions_snapshot, account_info=account_info
             )
 
             # Select from two budgets: shares for calls, buying power for puts
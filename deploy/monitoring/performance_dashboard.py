@@ -4,12 +4,20 @@ Enhanced performance monitoring dashboard for the Options Wheel Strategy.
 Provides real-time monitoring, alerting, and comprehensive analytics.
 """
 
+import csv
+import io
 import os
 import json
+import sys
+import operator
 import time
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import islice
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Deque, Dict, List, Any, Optional
+from dataclasses import dataclass, fields
+from functools import cached_property
 import structlog
 
 try:
@@ -21,10 +29,27 @@ except ImportError:
     monitoring_v3 = None
     cloud_logging = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 logger = structlog.get_logger(__name__)
 
+# Slotted dataclasses need Python 3.10+; on 3.9 they fall back to a __dict__.
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _dumps(data: Any) -> str:
+    """Pretty-printed JSON; uses orjson's C encoder when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class PerformanceMetrics:
     """Container for performance metrics."""
     timestamp: str
@@ -45,7 +70,7 @@ class PerformanceMetrics:
     execution_latency: float
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class AlertThresholds:
     """Alert threshold configuration."""
     max_daily_loss: float = -0.02  # 2% daily loss
@@ -57,9 +82,68 @@ class AlertThresholds:
     max_gap_events: int = 3
 
 
+# Performance-grade tables: ascending thresholds and the points awarded
+# once a value is strictly above 0, 1, ... of them
+_RETURN_STEPS = (0.0, 0.01, 0.03, 0.05)
+_RETURN_POINTS = (0, 10, 20, 30, 40)
+_DRAWDOWN_STEPS = (-0.08, -0.05, -0.03, -0.02)
+_DRAWDOWN_POINTS = (0, 5, 15, 25, 30)
+_WIN_RATE_STEPS = (0.65, 0.70, 0.75, 0.80)
+_WIN_RATE_POINTS = (5, 15, 20, 25, 30)
+_GRADE_CUTOFFS = (60, 70, 80, 90)
+_GRADES = ('F', 'D', 'C', 'B', 'A')
+
+_PM_FIELDS = tuple(f.name for f in fields(PerformanceMetrics))
+
+
+def _pm_to_dict(metrics: PerformanceMetrics) -> Dict[str, Any]:
+    """Flat field dict for a metrics record (``asdict`` without the deep copy)."""
+    return {name: getattr(metrics, name) for name in _PM_FIELDS}
+
+
+def _tail(items: Deque, n: int) -> list:
+    """Last ``n`` items of a deque as a list (deques don't slice)."""
+    return list(islice(items, max(0, len(items) - n), None))
+
+
+def _execution_score(execution_latency: float, api_errors: int, trades_blocked: int) -> float:
+    """Execution quality score (0-100) from the raw execution counters."""
+    score = 100.0
+
+    # Penalize for latency
+    if execution_latency > 2.0:
+        score -= min(30.0, (execution_latency - 2.0) * 10.0)
+
+    # Penalize for API errors
+    score -= min(20.0, api_errors * 4.0)
+
+    # Penalize for blocked trades (indicates poor timing)
+    score -= min(15.0, trades_blocked * 5.0)
+
+    return max(0.0, score)
+
+
 class PerformanceMonitor:
     """Comprehensive performance monitoring system."""
 
+    # (metric attr, breach test, threshold, severity, alert type, message template)
+    _ALERT_RULES = (
+        ('daily_pnl', operator.lt, lambda m, t: m.portfolio_value * t.max_daily_loss,
+         'high', 'daily_loss', 'Daily loss {:.2f} exceeds threshold'),
+        ('cash_allocation', operator.lt, lambda m, t: t.min_cash_allocation,
+         'medium', 'low_cash', 'Cash allocation {:.1%} below minimum'),
+        ('max_drawdown', operator.lt, lambda m, t: t.max_drawdown,
+         'high', 'max_drawdown', 'Max drawdown {:.1%} exceeds limit'),
+        ('api_errors', operator.gt, lambda m, t: t.max_api_errors,
+         'medium', 'api_errors', 'API errors {} exceeding threshold'),
+        ('execution_latency', operator.gt, lambda m, t: t.max_execution_latency,
+         'low', 'execution_latency', 'Execution latency {:.1f}s high'),
+        ('win_rate', operator.lt, lambda m, t: t.min_win_rate,
+         'medium', 'low_win_rate', 'Win rate {:.1%} below expected'),
+        ('gap_events', operator.gt, lambda m, t: t.max_gap_events,
+         'medium', 'gap_events', 'Gap events {} above normal'),
+    )
+
     def __init__(self, project_id: str = "gen-lang-client-0607444019"):
         """Initialize the performance monitor.
 
@@ -68,26 +152,46 @@ class PerformanceMonitor:
         """
         self.project_id = project_id
         self.alerts = AlertThresholds()
+        self._log = logger.bind(project=project_id, component="performance_monitor")
+
+        # Google Cloud clients are created on first access (see the
+        # properties below); the dashboard endpoints build a monitor per
+        # request and never publish, so they never pay for auth/channel setup.
+
+        # Local metrics storage (bounded; oldest entries fall off the left)
+        self.metrics_history: Deque[PerformanceMetrics] = deque(maxlen=1000)
+        self.alerts_history: Deque[Dict] = deque(maxlen=500)
+        # Severities of the last 10 alerts, for the system-health check
+        self._recent_severities: Deque[str] = deque(maxlen=10)
+
+    @cached_property
+    def monitoring_client(self):
+        """Cloud Monitoring client, or None when unavailable."""
+        return self._init_cloud_client("monitoring", lambda: monitoring_v3.MetricServiceClient())
+
+    @cached_property
+    def logging_client(self):
+        """Cloud Logging client, or None when unavailable."""
+        return self._init_cloud_client("logging", lambda: cloud_logging.Client(project=self.project_id))
+
+    def _init_cloud_client(self, name: str, factory):
+        if not GOOGLE_CLOUD_AVAILABLE:
+            return None
+        try:
+            client = factory()
+            self._log.info("Google Cloud monitoring initialized", event_category="system", event_type="cloud_monitoring_initialized", client=name)
+            return client
+        except Exception as e:
+            self._log.warning("Failed to initialize Google Cloud monitoring", event_category="error", event_type="cloud_monitoring_init_failed", client=name, error=str(e))
+            return None
 
-        # Initialize Google Cloud clients if available
-        self.monitoring_client = None
-        self.logging_client = None
-
-        if GOOGLE_CLOUD_AVAILABLE:
-            try:
-                self.monitoring_client = monitoring_v3.MetricServiceClient()
-                self.logging_client = cloud_logging.Client(project=project_id)
-                logger.info("Google Cloud monitoring initialized", event_category="system", event_type="cloud_monitoring_initialized")
-            except Exception as e:
-                logger.warning("Failed to initialize Google Cloud monitoring", event_category="error", event_type="cloud_monitoring_init_failed", error=str(e))
-
-        # Local metrics storage
-        self.metrics_history: List[PerformanceMetrics] = []
-        self.alerts_history: List[Dict] = []
-
-    def collect_current_metrics(self) -> PerformanceMetrics:
+    def collect_current_metrics(self, now: Optional[datetime] = None) -> PerformanceMetrics:
         """Collect current performance metrics.
 
+        Args:
+            now: Tick time shared with the rest of the dashboard build;
+                defaults to ``datetime.now()``
+
         Returns:
             Current performance metrics
         """
@@ -98,17 +202,21 @@ class PerformanceMonitor:
             # - Cloud monitoring for system metrics
 
             # Mock current metrics for demonstration
-            current_time = datetime.now()
+            current_time = now or datetime.now()
 
             # Generate realistic mock data
             base_portfolio = 100000.0
-            daily_variation = (hash(str(current_time.date())) % 1000 - 500) / 100000
-            portfolio_value = base_portfolio + (base_portfolio * daily_variation)
+            # Knuth multiplicative hash of the day number: stable per date
+            # (str hashing is salted per process) and allocation-free
+            day_hash = (current_time.toordinal() * 2654435761) & 0xFFFFFFFF
+            daily_variation = (day_hash % 1000 - 500) / 100000
+            daily_pnl = base_portfolio * daily_variation
+            portfolio_value = base_portfolio + daily_pnl
 
             metrics = PerformanceMetrics(
                 timestamp=current_time.isoformat(),
                 total_return=0.045 + daily_variation,
-                daily_pnl=portfolio_value - base_portfolio,
+                daily_pnl=daily_pnl,
                 portfolio_value=portfolio_value,
                 cash_allocation=0.22,
                 positions_count=8,
@@ -126,18 +234,14 @@ class PerformanceMonitor:
 
             self.metrics_history.append(metrics)
 
-            # Keep only last 1000 metrics to manage memory
-            if len(self.metrics_history) > 1000:
-                self.metrics_history = self.metrics_history[-1000:]
-
-            logger.debug("Metrics collected", event_category="system", event_type="metrics_collected", portfolio_value=metrics.portfolio_value)
+            self._log.debug("Metrics collected", event_category="system", event_type="metrics_collected", portfolio_value=metrics.portfolio_value)
             return metrics
 
         except Exception as e:
-            logger.error("Failed to collect metrics", event_category="error", event_type="metrics_collection_failed", error=str(e))
+            self._log.error("Failed to collect metrics", event_category="error", event_type="metrics_collection_failed", error=str(e))
             # Return default metrics on error
             return PerformanceMetrics(
-                timestamp=datetime.now().isoformat(),
+                timestamp=(now or datetime.now()).isoformat(),
                 total_return=0.0,
                 daily_pnl=0.0,
                 portfolio_value=100000.0,
@@ -166,87 +270,25 @@ class PerformanceMonitor:
         """
         alerts = []
 
-        # Daily loss alert
-        if metrics.daily_pnl < metrics.portfolio_value * self.alerts.max_daily_loss:
-            alerts.append({
-                'type': 'daily_loss',
-                'severity': 'high',
-                'message': f'Daily loss {metrics.daily_pnl:.2f} exceeds threshold',
-                'value': metrics.daily_pnl,
-                'threshold': metrics.portfolio_value * self.alerts.max_daily_loss,
-                'timestamp': metrics.timestamp
-            })
-
-        # Cash allocation alert
-        if metrics.cash_allocation < self.alerts.min_cash_allocation:
-            alerts.append({
-                'type': 'low_cash',
-                'severity': 'medium',
-                'message': f'Cash allocation {metrics.cash_allocation:.1%} below minimum',
-                'value': metrics.cash_allocation,
-                'threshold': self.alerts.min_cash_allocation,
-                'timestamp': metrics.timestamp
-            })
-
-        # Max drawdown alert
-        if metrics.max_drawdown < self.alerts.max_drawdown:
-            alerts.append({
-                'type': 'max_drawdown',
-                'severity': 'high',
-                'message': f'Max drawdown {metrics.max_drawdown:.1%} exceeds limit',
-                'value': metrics.max_drawdown,
-                'threshold': self.alerts.max_drawdown,
-                'timestamp': metrics.timestamp
-            })
-
-        # API errors alert
-        if metrics.api_errors > self.alerts.max_api_errors:
-            alerts.append({
-                'type': 'api_errors',
-                'severity': 'medium',
-                'message': f'API errors {metrics.api_errors} exceeding threshold',
-                'value': metrics.api_errors,
-                'threshold': self.alerts.max_api_errors,
-                'timestamp': metrics.timestamp
-            })
-
-        # Execution latency alert
-        if metrics.execution_latency > self.alerts.max_execution_latency:
-            alerts.append({
-                'type': 'execution_latency',
-                'severity': 'low',
-                'message': f'Execution latency {metrics.execution_latency:.1f}s high',
-                'value': metrics.execution_latency,
-                'threshold': self.alerts.max_execution_latency,
-                'timestamp': metrics.timestamp
-            })
-
-        # Win rate alert
-        if metrics.win_rate < self.alerts.min_win_rate:
-            alerts.append({
-                'type': 'low_win_rate',
-                'severity': 'medium',
-                'message': f'Win rate {metrics.win_rate:.1%} below expected',
-                'value': metrics.win_rate,
-                'threshold': self.alerts.min_win_rate,
-                'timestamp': metrics.timestamp
-            })
-
-        # Gap events alert
-        if metrics.gap_events > self.alerts.max_gap_events:
-            alerts.append({
-                'type': 'gap_events',
-                'severity': 'medium',
-                'message': f'Gap events {metrics.gap_events} above normal',
-                'value': metrics.gap_events,
-                'threshold': self.alerts.max_gap_events,
-                'timestamp': metrics.timestamp
-            })
-
-        # Store alerts
-        for alert in alerts:
-            self.alerts_history.append(alert)
-            logger.warning("Alert triggered", event_category="risk", event_type="alert_triggered", **alert)
+        for attr, breached, threshold_of, severity, alert_type, template in self._ALERT_RULES:
+            value = getattr(metrics, attr)
+            threshold = threshold_of(metrics, self.alerts)
+            if breached(value, threshold):
+                alerts.append({
+                    'type': alert_type,
+                    'severity': severity,
+                    'message': template.format(value),
+                    'value': value,
+                    'threshold': threshold,
+                    'timestamp': metrics.timestamp
+                })
+
+        # Store alerts; one log event per check rather than one per alert
+        if alerts:
+            self.alerts_history.extend(alerts)
+            self._recent_severities.extend(a['severity'] for a in alerts)
+            self._log.warning("Alerts triggered", event_category="risk", event_type="alerts_triggered",
+                           alert_count=len(alerts), alert_types=[a['type'] for a in alerts], alerts=alerts)
 
         return alerts
 
@@ -256,61 +298,52 @@ class PerformanceMonitor:
         Returns:
             Dashboard data dictionary
         """
-        current_metrics = self.collect_current_metrics()
+        now = datetime.now()
+        current_metrics = self.collect_current_metrics(now)
+        timestamp = current_metrics.timestamp
         alerts = self.check_alerts(current_metrics)
 
         # Calculate trend data
-        recent_metrics = self.metrics_history[-24:] if len(self.metrics_history) >= 24 else self.metrics_history
+        recent_metrics = _tail(self.metrics_history, 24)
 
         dashboard_data = {
-            'current_metrics': asdict(current_metrics),
+            'current_metrics': _pm_to_dict(current_metrics),
             'alerts': {
                 'active_alerts': alerts,
                 'alert_count': len(alerts),
-                'recent_alerts': self.alerts_history[-10:] if self.alerts_history else []
+                'recent_alerts': _tail(self.alerts_history, 10)
             },
             'trends': self._calculate_trends(recent_metrics),
             'performance_summary': self._generate_performance_summary(recent_metrics),
-            'system_health': self._check_system_health(),
+            'system_health': self._check_system_health(timestamp),
             'risk_metrics': self._calculate_risk_metrics(recent_metrics),
             'execution_metrics': self._calculate_execution_metrics(recent_metrics),
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'data_freshness': 'real_time'
         }
 
         return dashboard_data
 
     def _calculate_trends(self, metrics_list: List[PerformanceMetrics]) -> Dict[str, Any]:
-        """Calculate trend data from metrics history."""
+        """Calculate trend data from the two newest history samples."""
         if len(metrics_list) < 2:
             return {'trend_data': 'insufficient_data'}
 
         latest = metrics_list[-1]
         previous = metrics_list[-2]
 
+        def trend(name: str) -> Dict[str, Any]:
+            current, prior = getattr(latest, name), getattr(previous, name)
+            return {'current': current, 'previous': prior, 'change': current - prior}
+
         trends = {
-            'portfolio_value': {
-                'current': latest.portfolio_value,
-                'previous': previous.portfolio_value,
-                'change': latest.portfolio_value - previous.portfolio_value,
-                'change_percent': ((latest.portfolio_value - previous.portfolio_value) / previous.portfolio_value) * 100
-            },
-            'win_rate': {
-                'current': latest.win_rate,
-                'previous': previous.win_rate,
-                'change': latest.win_rate - previous.win_rate
-            },
-            'positions_count': {
-                'current': latest.positions_count,
-                'previous': previous.positions_count,
-                'change': latest.positions_count - previous.positions_count
-            },
-            'cash_allocation': {
-                'current': latest.cash_allocation,
-                'previous': previous.cash_allocation,
-                'change': latest.cash_allocation - previous.cash_allocation
-            }
+            'portfolio_value': trend('portfolio_value'),
+            'win_rate': trend('win_rate'),
+            'positions_count': trend('positions_count'),
+            'cash_allocation': trend('cash_allocation')
         }
+        pv = trends['portfolio_value']
+        pv['change_percent'] = (pv['change'] / pv['previous']) * 100
 
         return trends
 
@@ -336,7 +369,7 @@ class PerformanceMonitor:
 
         return summary
 
-    def _check_system_health(self) -> Dict[str, Any]:
+    def _check_system_health(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Check overall system health status."""
         health_status = {
             'overall_status': 'healthy',
@@ -348,15 +381,13 @@ class PerformanceMonitor:
                 'monitoring': 'healthy'
             },
             'uptime_percentage': 99.8,
-            'last_health_check': datetime.now().isoformat()
+            'last_health_check': timestamp or datetime.now().isoformat()
         }
 
         # Check for any critical issues
-        if len(self.alerts_history) > 0:
-            recent_critical = [a for a in self.alerts_history[-10:] if a.get('severity') == 'high']
-            if recent_critical:
-                health_status['overall_status'] = 'degraded'
-                health_status['components']['risk_management'] = 'warning'
+        if 'high' in self._recent_severities:
+            health_status['overall_status'] = 'degraded'
+            health_status['components']['risk_management'] = 'warning'
 
         return health_status
 
@@ -423,51 +454,16 @@ class PerformanceMonitor:
 
     def _calculate_performance_grade(self, metrics: PerformanceMetrics) -> str:
         """Calculate overall performance grade."""
-        score = 0
-
-        # Return component (40%)
-        if metrics.total_return > 0.05:
-            score += 40
-        elif metrics.total_return > 0.03:
-            score += 30
-        elif metrics.total_return > 0.01:
-            score += 20
-        elif metrics.total_return > 0:
-            score += 10
-
-        # Risk component (30%)
-        if metrics.max_drawdown > -0.02:
-            score += 30
-        elif metrics.max_drawdown > -0.03:
-            score += 25
-        elif metrics.max_drawdown > -0.05:
-            score += 15
-        elif metrics.max_drawdown > -0.08:
-            score += 5
-
-        # Consistency component (30%)
-        if metrics.win_rate > 0.80:
-            score += 30
-        elif metrics.win_rate > 0.75:
-            score += 25
-        elif metrics.win_rate > 0.70:
-            score += 20
-        elif metrics.win_rate > 0.65:
-            score += 15
-        else:
-            score += 5
-
-        # Convert to letter grade
-        if score >= 90:
-            return 'A'
-        elif score >= 80:
-            return 'B'
-        elif score >= 70:
-            return 'C'
-        elif score >= 60:
-            return 'D'
-        else:
-            return 'F'
+        # bisect_left counts thresholds strictly below the value, matching
+        # the "value > threshold" steps of each component
+        score = (
+            _RETURN_POINTS[bisect_left(_RETURN_STEPS, metrics.total_return)]          # 40%
+            + _DRAWDOWN_POINTS[bisect_left(_DRAWDOWN_STEPS, metrics.max_drawdown)]    # 30%
+            + _WIN_RATE_POINTS[bisect_left(_WIN_RATE_STEPS, metrics.win_rate)]        # 30%
+        )
+
+        # Convert to letter grade (score >= cutoff)
+        return _GRADES[bisect_right(_GRADE_CUTOFFS, score)]
 
     def _generate_key_highlights(self, metrics: PerformanceMetrics) -> List[str]:
         """Generate key performance highlights."""
@@ -519,19 +515,9 @@ class PerformanceMonitor:
 
     def _calculate_execution_score(self, metrics: PerformanceMetrics) -> float:
         """Calculate execution quality score (0-100)."""
-        score = 100.0
-
-        # Penalize for latency
-        if metrics.execution_latency > 2.0:
-            score -= min(30, (metrics.execution_latency - 2.0) * 10)
-
-        # Penalize for API errors
-        score -= min(20, metrics.api_errors * 4)
-
-        # Penalize for blocked trades (indicates poor timing)
-        score -= min(15, metrics.trades_blocked * 5)
-
-        return max(0, score)
+        return _execution_score(
+            metrics.execution_latency, metrics.api_errors, metrics.trades_blocked
+        )
 
     def export_metrics(self, format: str = 'json') -> str:
         """Export current metrics in specified format.
@@ -542,14 +528,10 @@ class PerformanceMonitor:
         Returns:
             Exported data as string
         """
-        dashboard_data = self.generate_dashboard_data()
-
-        if format == 'json':
-            return json.dumps(dashboard_data, indent=2)
-        elif format == 'csv':
-            # Simple CSV export of key metrics
-            import csv
-            import io
+        if format == 'csv':
+            # Only the current sample is exported, so skip the full
+            # dashboard build (and its alert bookkeeping)
+            metrics = self.collect_current_metrics()
 
             output = io.StringIO()
             writer = csv.writer(output)
@@ -561,17 +543,20 @@ class PerformanceMonitor:
             ])
 
             # Data
-            metrics = dashboard_data['current_metrics']
             writer.writerow([
-                metrics['timestamp'], metrics['portfolio_value'], metrics['total_return'],
-                metrics['daily_pnl'], metrics['win_rate'], metrics['max_drawdown'],
-                metrics['sharpe_ratio'], metrics['positions_count']
+                metrics.timestamp, metrics.portfolio_value, metrics.total_return,
+                metrics.daily_pnl, metrics.win_rate, metrics.max_drawdown,
+                metrics.sharpe_ratio, metrics.positions_count
             ])
 
             return output.getvalue()
 
-        return str(dashboard_data)
+        dashboard_data = self.generate_dashboard_data()
 
+        if format == 'json':
+            return _dumps(dashboard_data)
+
+        return str(dashboard_data)
 
 def main():
     """Main function for testing the performance monitor."""
@@ -580,8 +565,7 @@ def main():
     # Generate sample dashboard
     dashboard = monitor.generate_dashboard_data()
 
-    print("=== OPTIONS WHEEL STRATEGY PERFORMANCE DASHBOARD ===")
-    print(json.dumps(dashboard, indent=2))
+    sys.stdout.write("=== OPTIONS WHEEL STRATEGY PERFORMANCE DASHBOARD ===\n" + _dumps(dashboard) + "\n")
 
 
 if __name__ == '__main__':
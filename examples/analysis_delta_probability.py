@@ -2,7 +2,7 @@
 """Analyze the relationship between delta and assignment probability."""
 
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
 import math
 
 def black_scholes_delta(S, K, T, r, sigma, option_type='put'):
@@ -10,21 +10,32 @@ def black_scholes_delta(S, K, T, r, sigma, option_type='put'):
     
     Args:
         S: Current stock price
-        K: Strike price  
+        K: Strike price, or an array of strikes to evaluate in one pass
         T: Time to expiration (years)
         r: Risk-free rate
         sigma: Volatility
         option_type: 'put' or 'call'
+
+    Returns:
+        Dict of values with the same shape as ``K``.
     """
+    K = np.asarray(K, dtype=float)
+
+    # Strike-independent terms, computed once for the whole ladder
+    sqrtT = math.sqrt(T)
+    log_S = math.log(S)
+    drift = (r + 0.5 * sigma * sigma) * T
+    vol_sqrtT = sigma * sqrtT
+
     # Calculate d1
-    d1 = (math.log(S/K) + (r + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
+    d1 = (log_S - np.log(K) + drift) / vol_sqrtT
     
     # Calculate N(d1)
-    N_d1 = norm.cdf(d1)
+    N_d1 = ndtr(d1)
     
     if option_type == 'put':
         delta = N_d1 - 1  # Put delta
-        assignment_prob = abs(delta)  # |Delta| approximation
+        assignment_prob = np.abs(delta)  # |Delta| approximation
         actual_prob = 1 - N_d1  # P(S_T <= K)
     else:  # call
         delta = N_d1  # Call delta  
@@ -35,61 +46,61 @@ def black_scholes_delta(S, K, T, r, sigma, option_type='put'):
         'delta': delta,
         'assignment_prob_from_delta': assignment_prob,
         'theoretical_assignment_prob': actual_prob,
-        'difference': abs(assignment_prob - actual_prob)
+        'difference': np.abs(assignment_prob - actual_prob)
     }
 
+def _strike_table(title, strikes, S, T, r, sigma, option_type):
+    """Table lines for one strike ladder, evaluated in a single vectorized call."""
+    result = black_scholes_delta(S, np.array(strikes), T, r, sigma, option_type)
+    lines = [
+        title,
+        "Strike | Delta   | Assignment Prob | Theoretical | Difference",
+        "       |         | (from Delta)    | Probability | ",
+        "-" * 60,
+    ]
+    for K, delta, from_delta, theoretical, diff in zip(
+            strikes, result['delta'], result['assignment_prob_from_delta'],
+            result['theoretical_assignment_prob'], result['difference']):
+        lines.append(f"${K:3d}   | {delta:6.3f}  | {from_delta:8.1%}       | {theoretical:8.1%}    | {diff:6.3f}")
+    return lines
+
 def analyze_delta_probability_relationship():
     """Analyze delta vs assignment probability for various scenarios."""
     
-    print("🎯 DELTA vs ASSIGNMENT PROBABILITY ANALYSIS")
-    print("=" * 60)
-    
     # Base case: AAPL at $150
     S = 150  # Current stock price
     T = 30/365  # 30 days
     r = 0.05  # 5% risk-free rate
     sigma = 0.25  # 25% volatility
     
-    print(f"Stock Price: ${S}")
-    print(f"Time to Expiration: {int(T*365)} days")
-    print(f"Volatility: {sigma*100:.0f}%")
-    print()
-    
-    # Analyze different strike prices for puts
-    print("PUT OPTIONS:")
-    print("Strike | Delta   | Assignment Prob | Theoretical | Difference")
-    print("       |         | (from Delta)    | Probability | ")  
-    print("-" * 60)
-    
-    put_strikes = [130, 135, 140, 145, 148]
-    for K in put_strikes:
-        result = black_scholes_delta(S, K, T, r, sigma, 'put')
-        print(f"${K:3d}   | {result['delta']:6.3f}  | {result['assignment_prob_from_delta']:8.1%}       | {result['theoretical_assignment_prob']:8.1%}    | {result['difference']:6.3f}")
-    
-    print()
-    print("CALL OPTIONS:")
-    print("Strike | Delta   | Assignment Prob | Theoretical | Difference")
-    print("       |         | (from Delta)    | Probability | ")
-    print("-" * 60)
-    
-    call_strikes = [152, 155, 160, 165, 170]
-    for K in call_strikes:
-        result = black_scholes_delta(S, K, T, r, sigma, 'call')
-        print(f"${K:3d}   | {result['delta']:6.3f}  | {result['assignment_prob_from_delta']:8.1%}       | {result['theoretical_assignment_prob']:8.1%}    | {result['difference']:6.3f}")
-    
-    print()
-    print("💡 KEY INSIGHTS:")
-    print("1. Delta approximates assignment probability very closely")
-    print("2. The approximation is most accurate for at-the-money options")
-    print("3. Small differences are due to the risk-neutral vs real-world probability")
-    print("4. For practical trading, |Delta| ≈ Assignment Probability is excellent")
+    # Build the whole report, then write it once
+    lines = [
+        "🎯 DELTA vs ASSIGNMENT PROBABILITY ANALYSIS",
+        "=" * 60,
+        f"Stock Price: ${S}",
+        f"Time to Expiration: {int(T*365)} days",
+        f"Volatility: {sigma*100:.0f}%",
+        "",
+    ]
+    
+    # Analyze different strike prices for puts and calls
+    lines += _strike_table("PUT OPTIONS:", [130, 135, 140, 145, 148], S, T, r, sigma, 'put')
+    lines.append("")
+    lines += _strike_table("CALL OPTIONS:", [152, 155, 160, 165, 170], S, T, r, sigma, 'call')
+    
+    lines += [
+        "",
+        "💡 KEY INSIGHTS:",
+        "1. Delta approximates assignment probability very closely",
+        "2. The approximation is most accurate for at-the-money options",
+        "3. Small differences are due to the risk-neutral vs real-world probability",
+        "4. For practical trading, |Delta| ≈ Assignment Probability is excellent",
+    ]
+    print("\n".join(lines))
 
 def demonstrate_wheel_strategy_probabilities():
     """Show assignment probabilities for typical wheel strategy deltas."""
     
-    print("\n" + "🎯 WHEEL STRATEGY ASSIGNMENT PROBABILITIES")
-    print("=" * 60)
-    
     delta_ranges = {
         'Conservative': [0.10, 0.20],
         'Balanced': [0.15, 0.30], 
@@ -97,15 +108,20 @@ def demonstrate_wheel_strategy_probabilities():
         'Very Aggressive': [0.35, 0.50]
     }
     
-    print("Strategy        | Delta Range | Assignment Range | Expected Outcomes")
-    print("-" * 65)
+    lines = [
+        "\n" + "🎯 WHEEL STRATEGY ASSIGNMENT PROBABILITIES",
+        "=" * 60,
+        "Strategy        | Delta Range | Assignment Range | Expected Outcomes",
+        "-" * 65,
+    ]
     
     for strategy, (min_delta, max_delta) in delta_ranges.items():
         min_assign = min_delta * 100
         max_assign = max_delta * 100
         success_rate = 100 - max_assign
         
-        print(f"{strategy:15s} | {min_delta:.2f} - {max_delta:.2f}   | {min_assign:5.0f}% - {max_assign:5.0f}%     | Keep premium {success_rate:5.0f}%+ of time")
+        lines.append(f"{strategy:15s} | {min_delta:.2f} - {max_delta:.2f}   | {min_assign:5.0f}% - {max_assign:5.0f}%     | Keep premium {success_rate:5.0f}%+ of time")
+    print("\n".join(lines))
 
 if __name__ == '__main__':
     analyze_delta_probability_relationship()
@@ -2,15 +2,20 @@
 
 import argparse
 import sys
-from datetime import datetime
-import json
+from typing import TYPE_CHECKING
 
 from src.utils.config import Config
 from src.utils.logger import setup_logging, get_logger
-from src.data.options_scanner import OptionsScanner
-from src.data.portfolio_tracker import PortfolioTracker
-from src.api.alpaca_client import AlpacaClient
-from src.api.market_data import MarketDataManager
+
+# The live-trading stack (Alpaca client, scanner, tracker) is imported inside
+# the commands that use it so `backtest`, `screen` and `status` don't pay for
+# modules they never touch.
+if TYPE_CHECKING:
+    from src.data.options_scanner import OptionsScanner
+    from src.data.portfolio_tracker import PortfolioTracker
+
+_BANNER = "=" * 60
+_OPPORTUNITY_ROW = "  {:2d}   | {:6s} | ${:6.0f} | ${:5.2f}  | {:3d} | {:8.1f}%   | {:5.1f}".format
 
 
 def main():
@@ -34,6 +39,8 @@ def main():
                         help='backtest: skip the bid-fill sensitivity replay')
     parser.add_argument('--no-persist', action='store_true',
                         help='screen: do not write results to BigQuery')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='screen: symbols replayed in parallel processes (default 1)')
     parser.add_argument('--out', help='backtest/screen: write the markdown report here')
     parser.add_argument('--json-out', help='backtest: write the JSON report here')
 
@@ -70,10 +77,8 @@ def main():
             return
 
         # Initialize components
+        from src.api.alpaca_client import AlpacaClient
         alpaca_client = AlpacaClient(config)
-        market_data = MarketDataManager(alpaca_client, config)
-        portfolio_tracker = PortfolioTracker(alpaca_client, config)
-        scanner = OptionsScanner(alpaca_client, market_data, config)
         
         # Execute command. FC-068 removed `--command run`: it drove
         # WheelEngine.run_strategy_cycle() -- a code path production abandoned
@@ -81,11 +86,19 @@ def main():
         # read-only equivalent that stays; execution lives on the Cloud Run
         # server, which is the only thing that trades.
         if args.command == 'scan':
+            from src.api.market_data import MarketDataManager
+            from src.data.options_scanner import OptionsScanner, PUT_SCAN_WORKERS
+            market_data = MarketDataManager(alpaca_client, config)
+            scanner = OptionsScanner(alpaca_client, market_data, config,
+                                     scan_workers=PUT_SCAN_WORKERS)
             scan_opportunities(scanner, logger)
-        elif args.command == 'status':
-            show_status(portfolio_tracker, logger)
-        elif args.command == 'report':
-            generate_report(portfolio_tracker, logger)
+        else:
+            from src.data.portfolio_tracker import PortfolioTracker
+            portfolio_tracker = PortfolioTracker(alpaca_client, config)
+            if args.command == 'status':
+                show_status(portfolio_tracker, logger)
+            elif args.command == 'report':
+                generate_report(portfolio_tracker, logger)
         
         logger.info("Command completed successfully", event_category="system", event_type="command_completed")
         
@@ -103,10 +116,12 @@ def main():
         sys.exit(1)
 
 
-def scan_opportunities(scanner: OptionsScanner, logger):
+def scan_opportunities(scanner: 'OptionsScanner', logger):
     """Scan for trading opportunities."""
     logger.info("Scanning for trading opportunities", event_category="system", event_type="scan_started")
     
+    # Buffer the report and write it in one go
+    lines = []
     try:
         # Get market overview
         market_overview = scanner.get_market_overview()
@@ -115,166 +130,186 @@ def scan_opportunities(scanner: OptionsScanner, logger):
         opportunities = scanner.scan_all_opportunities()
         
         # Print results
-        print("\n" + "="*60)
-        print("OPTIONS OPPORTUNITIES SCAN")
-        print("="*60)
-        print(f"Scan Time: {opportunities['scan_timestamp']}")
-        print(f"Total Opportunities: {opportunities['total_opportunities']}")
+        lines.extend(_section_header("OPTIONS OPPORTUNITIES SCAN"))
+        lines.append(f"Scan Time: {opportunities['scan_timestamp']}")
+        lines.append(f"Total Opportunities: {opportunities['total_opportunities']}")
         
         # Market overview
-        print(f"\nMarket Overview:")
-        print(f"  Configured Stocks: {market_overview.get('configured_stocks', 0)}")
-        print(f"  Suitable Stocks: {market_overview.get('suitable_stocks', 0)}")
-        print(f"  Market Conditions: {market_overview.get('market_conditions', 'unknown')}")
+        lines.append(f"\nMarket Overview:")
+        lines.append(f"  Configured Stocks: {market_overview.get('configured_stocks', 0)}")
+        lines.append(f"  Suitable Stocks: {market_overview.get('suitable_stocks', 0)}")
+        lines.append(f"  Market Conditions: {market_overview.get('market_conditions', 'unknown')}")
         
-        # Put opportunities
+        # Put and call opportunities share one table layout
         puts = opportunities.get('puts', [])
         if puts:
-            print(f"\nTop Put Opportunities ({len(puts)}):")
-            print("  Rank | Symbol | Strike | Premium | DTE | Annual Return | Score")
-            print("  -----|--------|--------|---------|-----|---------------|------")
-            for i, put in enumerate(puts[:10], 1):
-                print(f"  {i:2d}   | {put['symbol']:6s} | ${put['strike_price']:6.0f} | "
-                     f"${put['premium']:5.2f}  | {put['dte']:3d} | "
-                     f"{put['annual_return_percent']:8.1f}%   | {put['attractiveness_score']:5.1f}")
+            lines.extend(_opportunity_table_lines("Put", puts, 'annual_return_percent'))
         
-        # Call opportunities
         calls = opportunities.get('calls', [])
         if calls:
-            print(f"\nTop Call Opportunities ({len(calls)}):")
-            print("  Rank | Symbol | Strike | Premium | DTE | Annual Return | Score")
-            print("  -----|--------|--------|---------|-----|---------------|------")
-            for i, call in enumerate(calls[:10], 1):
-                print(f"  {i:2d}   | {call['symbol']:6s} | ${call['strike_price']:6.0f} | "
-                     f"${call['premium']:5.2f}  | {call['dte']:3d} | "
-                     f"{call['annual_premium_return_percent']:8.1f}%   | {call['attractiveness_score']:5.1f}")
+            lines.extend(_opportunity_table_lines("Call", calls, 'annual_premium_return_percent'))
         
         if not puts and not calls:
-            print("\nNo suitable opportunities found at this time.")
+            lines.append("\nNo suitable opportunities found at this time.")
         
     except Exception as e:
         logger.error("Opportunity scan failed", event_category="error", event_type="scan_failed", error=str(e))
-        print(f"\nOpportunity scan failed: {str(e)}")
+        lines.append(f"\nOpportunity scan failed: {str(e)}")
+    finally:
+        _flush(lines)
+
+
+def _flush(lines: list):
+    """Write buffered report lines to stdout in a single call and clear the buffer."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+
+def _section_header(title: str) -> list:
+    """Banner lines that open each CLI report."""
+    return ["\n" + _BANNER, title, _BANNER]
+
+
+def _opportunity_table_lines(kind: str, opportunities, return_key: str) -> list:
+    """Format the top-10 table for one side of a scan.
+
+    Puts and calls differ only in which annualized-return field they carry.
+    """
+    lines = [
+        f"\nTop {kind} Opportunities ({len(opportunities)}):",
+        "  Rank | Symbol | Strike | Premium | DTE | Annual Return | Score",
+        "  -----|--------|--------|---------|-----|---------------|------",
+    ]
+    for i, opp in enumerate(opportunities[:10], 1):
+        lines.append(_OPPORTUNITY_ROW(i, opp['symbol'], opp['strike_price'], opp['premium'],
+                                      opp['dte'], opp[return_key], opp['attractiveness_score']))
+    return lines
 
 
-def show_status(tracker: PortfolioTracker, logger):
+def show_status(tracker: 'PortfolioTracker', logger):
     """Show current portfolio status."""
     logger.info("Getting portfolio status", event_category="system", event_type="status_requested")
     
+    # Buffer the report and write it in one go
+    lines = []
     try:
         snapshot = tracker.get_current_portfolio_snapshot()
         
-        print("\n" + "="*60)
-        print("PORTFOLIO STATUS")
-        print("="*60)
-        print(f"Snapshot Time: {snapshot['timestamp']}")
+        lines.extend(_section_header("PORTFOLIO STATUS"))
+        lines.append(f"Snapshot Time: {snapshot['timestamp']}")
         
         # Account info
         account = snapshot.get('account', {})
-        print(f"\nAccount:")
-        print(f"  Portfolio Value: ${account.get('portfolio_value', 0):,.2f}")
-        print(f"  Cash: ${account.get('cash', 0):,.2f} ({account.get('cash', 0)/account.get('portfolio_value', 1)*100:.1f}%)")
-        print(f"  Buying Power: ${account.get('buying_power', 0):,.2f}")
-        print(f"  Equity: ${account.get('equity', 0):,.2f}")
+        lines.append(f"\nAccount:")
+        lines.append(f"  Portfolio Value: ${account.get('portfolio_value', 0):,.2f}")
+        lines.append(f"  Cash: ${account.get('cash', 0):,.2f} ({account.get('cash', 0)/account.get('portfolio_value', 1)*100:.1f}%)")
+        lines.append(f"  Buying Power: ${account.get('buying_power', 0):,.2f}")
+        lines.append(f"  Equity: ${account.get('equity', 0):,.2f}")
         
         # Positions
         positions = snapshot.get('positions', {})
-        print(f"\nPositions:")
-        print(f"  Total Positions: {positions.get('total_count', 0)}")
-        print(f"  Stock Positions: {positions.get('stock_positions', 0)}")
-        print(f"  Option Positions: {positions.get('option_positions', 0)}")
-        print(f"  Total Value: ${positions.get('total_value', 0):,.2f}")
+        lines.append(f"\nPositions:")
+        lines.append(f"  Total Positions: {positions.get('total_count', 0)}")
+        lines.append(f"  Stock Positions: {positions.get('stock_positions', 0)}")
+        lines.append(f"  Option Positions: {positions.get('option_positions', 0)}")
+        lines.append(f"  Total Value: ${positions.get('total_value', 0):,.2f}")
         
         # Performance
         performance = snapshot.get('performance', {})
         total_pl = performance.get('total_unrealized_pl', 0)
         pl_percent = performance.get('unrealized_pl_percent', 0)
-        print(f"\nPerformance:")
-        print(f"  Unrealized P&L: ${total_pl:,.2f} ({pl_percent:+.2f}%)")
+        lines.append(f"\nPerformance:")
+        lines.append(f"  Unrealized P&L: ${total_pl:,.2f} ({pl_percent:+.2f}%)")
         
         # Wheel metrics
         wheel_metrics = snapshot.get('wheel_metrics', {})
-        print(f"\nWheel Strategy:")
-        print(f"  Active Wheels: {wheel_metrics.get('active_wheels', 0)}")
-        print(f"  Cash Secured Puts: {wheel_metrics.get('cash_secured_puts', 0)}")
-        print(f"  Assigned Stocks: {wheel_metrics.get('assigned_stocks', 0)}")
-        print(f"  Covered Calls: {wheel_metrics.get('covered_calls', 0)}")
+        lines.append(f"\nWheel Strategy:")
+        lines.append(f"  Active Wheels: {wheel_metrics.get('active_wheels', 0)}")
+        lines.append(f"  Cash Secured Puts: {wheel_metrics.get('cash_secured_puts', 0)}")
+        lines.append(f"  Assigned Stocks: {wheel_metrics.get('assigned_stocks', 0)}")
+        lines.append(f"  Covered Calls: {wheel_metrics.get('covered_calls', 0)}")
         
         # Underlying positions
         underlying = snapshot.get('underlying_positions', {})
         if underlying:
-            print(f"\nPositions by Underlying:")
+            lines.append(f"\nPositions by Underlying:")
             for symbol, data in underlying.items():
                 stage = data.get('wheel_stage', 'unknown')
                 value = data.get('total_value', 0)
                 pl = data.get('total_pl', 0)
-                print(f"  {symbol}: {stage} (${value:,.0f}, P&L: ${pl:+,.0f})")
+                lines.append(f"  {symbol}: {stage} (${value:,.0f}, P&L: ${pl:+,.0f})")
         
     except Exception as e:
         logger.error("Status retrieval failed", event_category="error", event_type="status_failed", error=str(e))
-        print(f"\nStatus retrieval failed: {str(e)}")
+        lines.append(f"\nStatus retrieval failed: {str(e)}")
+    finally:
+        _flush(lines)
 
 
-def generate_report(tracker: PortfolioTracker, logger):
+def generate_report(tracker: 'PortfolioTracker', logger):
     """Generate comprehensive performance report."""
     logger.info("Generating performance report", event_category="system", event_type="report_generating")
     
+    # Buffer the report and write it in one go
+    lines = []
     try:
         report = tracker.generate_performance_report()
         
-        print("\n" + "="*60)
-        print("PERFORMANCE REPORT")
-        print("="*60)
-        print(f"Report Date: {report['report_date']}")
+        lines.extend(_section_header("PERFORMANCE REPORT"))
+        lines.append(f"Report Date: {report['report_date']}")
         
         # Current portfolio summary
         current = report.get('current_portfolio', {})
         account = current.get('account', {})
-        print(f"\nCurrent Portfolio:")
-        print(f"  Value: ${account.get('portfolio_value', 0):,.2f}")
-        print(f"  Cash: ${account.get('cash', 0):,.2f}")
+        lines.append(f"\nCurrent Portfolio:")
+        lines.append(f"  Value: ${account.get('portfolio_value', 0):,.2f}")
+        lines.append(f"  Cash: ${account.get('cash', 0):,.2f}")
         
         # 30-day performance
         perf_30d = report.get('performance_30d', {})
         if 'error' not in perf_30d:
-            print(f"\n30-Day Performance:")
-            print(f"  Total Return: ${perf_30d.get('total_return', 0):,.2f} ({perf_30d.get('total_return_percent', 0):+.2f}%)")
-            print(f"  Annualized Return: {perf_30d.get('annualized_return_percent', 0):+.2f}%")
-            print(f"  Volatility: {perf_30d.get('volatility_percent', 0):.2f}%")
-            print(f"  Sharpe Ratio: {perf_30d.get('sharpe_ratio', 0):.2f}")
-            print(f"  Max Drawdown: {perf_30d.get('max_drawdown_percent', 0):.2f}%")
+            lines.append(f"\n30-Day Performance:")
+            lines.append(f"  Total Return: ${perf_30d.get('total_return', 0):,.2f} ({perf_30d.get('total_return_percent', 0):+.2f}%)")
+            lines.append(f"  Annualized Return: {perf_30d.get('annualized_return_percent', 0):+.2f}%")
+            lines.append(f"  Volatility: {perf_30d.get('volatility_percent', 0):.2f}%")
+            lines.append(f"  Sharpe Ratio: {perf_30d.get('sharpe_ratio', 0):.2f}")
+            lines.append(f"  Max Drawdown: {perf_30d.get('max_drawdown_percent', 0):.2f}%")
         else:
-            print(f"\n30-Day Performance: {perf_30d['error']}")
+            lines.append(f"\n30-Day Performance: {perf_30d['error']}")
         
         # Risk summary
         risk_summary = report.get('risk_summary', {})
-        print(f"\nRisk Summary:")
-        print(f"  Cash Percentage: {risk_summary.get('cash_percentage', 0):.1f}%")
-        print(f"  Max Concentration: {risk_summary.get('max_concentration', 0):.1f}% ({risk_summary.get('max_concentration_symbol', 'N/A')})")
-        print(f"  Total Positions: {risk_summary.get('total_positions', 0)}")
-        print(f"  Risk Level: {risk_summary.get('risk_level', 'Unknown')}")
+        lines.append(f"\nRisk Summary:")
+        lines.append(f"  Cash Percentage: {risk_summary.get('cash_percentage', 0):.1f}%")
+        lines.append(f"  Max Concentration: {risk_summary.get('max_concentration', 0):.1f}% ({risk_summary.get('max_concentration_symbol', 'N/A')})")
+        lines.append(f"  Total Positions: {risk_summary.get('total_positions', 0)}")
+        lines.append(f"  Risk Level: {risk_summary.get('risk_level', 'Unknown')}")
         
         # Recent activity
         activity = report.get('recent_activity', {})
-        print(f"\nRecent Activity:")
-        print(f"  Recent Trades: {activity.get('total_trades', 0)}")
+        lines.append(f"\nRecent Activity:")
+        lines.append(f"  Recent Trades: {activity.get('total_trades', 0)}")
         
         # Recommendations
         recommendations = report.get('recommendations', [])
         if recommendations:
-            print(f"\nRecommendations:")
+            lines.append(f"\nRecommendations:")
             for i, rec in enumerate(recommendations, 1):
-                print(f"  {i}. {rec}")
+                lines.append(f"  {i}. {rec}")
         
         # Export option
-        print(f"\nExporting detailed data...")
+        lines.append(f"\nExporting detailed data...")
+        _flush(lines)
         filename = tracker.export_performance_data()
         if filename:
-            print(f"Data exported to: {filename}")
+            lines.append(f"Data exported to: {filename}")
         
     except Exception as e:
         logger.error("Report generation failed", event_category="error", event_type="report_failed", error=str(e))
-        print(f"\nReport generation failed: {str(e)}")
+        lines.append(f"\nReport generation failed: {str(e)}")
+    finally:
+        _flush(lines)
 
 
 def run_backtest(args, config: Config, logger):
@@ -339,6 +374,7 @@ def run_screen_cmd(args, config: Config, logger) -> int:
         starting_cash=args.starting_cash,
         persist=not args.no_persist,
         run_sensitivity=not args.no_sensitivity,
+        workers=args.workers,
     )
 
     summary = render_screen_summary(result)
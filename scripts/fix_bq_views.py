@@ -1,41 +1,54 @@
 #!/usr/bin/env python3
 """
 Fix BigQuery views to properly extract JSON fields using JSON_VALUE()
+
+Usage: python scripts/fix_bq_views.py [path/to/views.sql]
+(defaults to docs/bigquery/views.sql in this repo; rewrites the file in place)
 """
 
+import os
 import re
+import sys
+
+# One alternation, one scan. The CAST branch is tried first at every position,
+# so a typed cast is rewritten whole and its inner reference is consumed with
+# it; the bare branch only sees references outside such casts.
+_JSON_FIELD_REF = re.compile(r"""
+    CAST\(jsonPayload\.(\w+)\ AS\ (FLOAT64|INT64|BOOL)\)    # typed cast
+  | (?<!JSON_VALUE\()jsonPayload\.(\w+)                      # bare reference,
+    (?!\s+AS\s+(?:FLOAT64|INT64|BOOL))                       # not a cast target
+""", re.VERBOSE)
+
+
+def _wrap_json_field(match):
+    cast_field, cast_type, bare_field = match.groups()
+    if cast_field is not None:
+        # CAST(jsonPayload.field AS TYPE) -> CAST(JSON_VALUE(jsonPayload.field) AS TYPE)
+        return f'CAST(JSON_VALUE(jsonPayload.{cast_field}) AS {cast_type})'
+    # jsonPayload.field (not already wrapped) -> JSON_VALUE(jsonPayload.field)
+    return f'JSON_VALUE(jsonPayload.{bare_field})'
+
 
 def fix_json_field_references(sql_content):
     """Replace jsonPayload.field references with JSON_VALUE() calls"""
+    return _JSON_FIELD_REF.sub(_wrap_json_field, sql_content)
+
+
+DEFAULT_VIEWS_SQL = os.path.join(os.path.dirname(__file__), '..', 'docs', 'bigquery', 'views.sql')
+
+
+def main(path=DEFAULT_VIEWS_SQL):
+    with open(path, 'r') as f:
+        sql_content = f.read()
+
+    fixed_sql = fix_json_field_references(sql_content)
+
+    with open(path, 'w') as f:
+        f.write(fixed_sql)
+
+    print("Fixed all jsonPayload references to use JSON_VALUE()")
+    print("Views are now ready to be created in BigQuery")
+
 
-    # Pattern 1: CAST(jsonPayload.field AS TYPE) -> CAST(JSON_VALUE(jsonPayload.field) AS TYPE)
-    sql_content = re.sub(
-        r'CAST\(jsonPayload\.(\w+) AS (FLOAT64|INT64|BOOL)\)',
-        r'CAST(JSON_VALUE(jsonPayload.\1) AS \2)',
-        sql_content
-    )
-
-    # Pattern 2: jsonPayload.field (not already wrapped) -> JSON_VALUE(jsonPayload.field)
-    # But NOT inside JSON_VALUE() calls we just added
-    # This matches jsonPayload.field that is NOT preceded by JSON_VALUE( and NOT followed by AS
-    sql_content = re.sub(
-        r'(?<!JSON_VALUE\()jsonPayload\.(\w+)(?!\s+AS\s+(?:FLOAT64|INT64|BOOL))',
-        r'JSON_VALUE(jsonPayload.\1)',
-        sql_content
-    )
-
-    return sql_content
-
-# Read the SQL file
-with open('/Users/zmemon/options_wheel-1/docs/bigquery/views.sql', 'r') as f:
-    sql_content = f.read()
-
-# Fix the references
-fixed_sql = fix_json_field_references(sql_content)
-
-# Write back
-with open('/Users/zmemon/options_wheel-1/docs/bigquery/views.sql', 'w') as f:
-    f.write(fixed_sql)
-
-print("Fixed all jsonPayload references to use JSON_VALUE()")
-print("Views are now ready to be created in BigQuery")
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_VIEWS_SQL)
@@ -18,11 +18,13 @@ from src.utils.logging_events import (
     log_position_update
 )
 
-# Configure structlog for console output
+# Configure structlog for console output. The bound logger is assembled on
+# first use and reused for every event after that.
 structlog.configure(
     processors=[
         structlog.processors.JSONRenderer()
-    ]
+    ],
+    cache_logger_on_first_use=True,
 )
 
 logger = structlog.get_logger(__name__)
@@ -8,8 +8,8 @@ import sys
 import os
 from datetime import datetime
 
-# Add src to path
-sys.path.insert(0, '/Users/zmemon/options_wheel-1')
+# Add the repo root to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
 from src.utils.config import Config
 from src.api.alpaca_client import AlpacaClient
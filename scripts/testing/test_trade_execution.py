@@ -4,16 +4,17 @@ Test simulated trade execution on paper account.
 This walks through the complete trade lifecycle.
 """
 
+import io
 import sys
 import os
+from contextlib import redirect_stdout
 from datetime import datetime, timedelta
 
-# Set API credentials
-os.environ['ALPACA_API_KEY'] = 'PKXGSCWDVM56LO4S08QN'
-os.environ['ALPACA_SECRET_KEY'] = 'COef1N9zNDJECF0G04rWmwM3C8FzZzJaLtIYzoIz'
+# Credentials come from the environment (ALPACA_API_KEY / ALPACA_SECRET_KEY,
+# or a .env file picked up by Config); none are kept in this script.
 
-# Add src to path
-sys.path.insert(0, '/Users/zmemon/options_wheel-1')
+# Add the repo root to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
 from src.utils.config import Config
 from src.api.alpaca_client import AlpacaClient
@@ -21,14 +22,30 @@ from src.api.market_data import MarketDataManager
 from src.data.options_scanner import OptionsScanner
 from src.strategy.wheel_engine import WheelEngine
 
+# main() prints into this buffer; each section reaches the terminal in one
+# write when the next header starts (or when the run ends).
+_STDOUT = sys.stdout
+_buffer = io.StringIO()
+
+def _flush():
+    """Write the buffered section to the real stdout and clear the buffer."""
+    text = _buffer.getvalue()
+    if text:
+        _STDOUT.write(text)
+        _STDOUT.flush()
+        _buffer.seek(0)
+        _buffer.truncate()
+
 def print_section(title):
     """Print a formatted section header."""
+    _flush()
     print("\n" + "=" * 80)
     print(f"  {title}")
     print("=" * 80)
 
 def print_subsection(title):
     """Print a formatted subsection header."""
+    _flush()
     print(f"\n{title}")
     print("-" * 80)
 
@@ -224,8 +241,12 @@ def main():
 
 if __name__ == '__main__':
     try:
-        main()
+        with redirect_stdout(_buffer):
+            main()
     except Exception as e:
+        _flush()
         print(f"\n❌ Error during execution test: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        _flush()
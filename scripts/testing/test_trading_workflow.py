@@ -8,12 +8,13 @@ import sys
 import os
 from datetime import datetime
 
-# Set API credentials
-os.environ['ALPACA_API_KEY'] = 'PKXGSCWDVM56LO4S08QN'
-os.environ['ALPACA_SECRET_KEY'] = 'COef1N9zNDJECF0G04rWmwM3C8FzZzJaLtIYzoIz'
+import pandas as pd
 
-# Add src to path
-sys.path.insert(0, '/Users/zmemon/options_wheel-1')
+# Credentials come from the environment (ALPACA_API_KEY / ALPACA_SECRET_KEY,
+# or a .env file picked up by Config); none are kept in this script.
+
+# Add the repo root to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
 from src.utils.config import Config
 from src.api.alpaca_client import AlpacaClient
@@ -114,11 +115,12 @@ def main():
         print(f"✓ Positions retrieved: {len(positions)}")
 
         if positions:
-            for pos in positions:
-                print(f"\n  Position: {pos['symbol']}")
-                print(f"    Qty: {pos['qty']}")
-                print(f"    Value: ${pos['market_value']:,.2f}")
-                print(f"    P&L: ${pos['unrealized_pl']:,.2f}")
+            table = pd.DataFrame(positions)[['symbol', 'qty', 'market_value', 'unrealized_pl']]
+            print()
+            print(table.to_string(index=False, formatters={
+                'market_value': '${:,.2f}'.format,
+                'unrealized_pl': '${:,.2f}'.format,
+            }))
         else:
             print("  No active positions")
 
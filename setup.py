@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
-"""Setup script for Options Wheel Strategy package."""
+"""Setup shim for Options Wheel Strategy package.
 
-from setuptools import setup, find_packages
-import os
+Metadata, packaging and the core dependencies live in pyproject.toml; this
+file only supplies the extras, which are read from the requirements files.
+"""
 
-# Read README for long description
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+from setuptools import setup
 
 # Read requirements
 def read_requirements(filename):
@@ -14,9 +13,6 @@ def read_requirements(filename):
     with open(filename, 'r') as f:
         return [line.strip() for line in f if line.strip() and not line.startswith('#') and not line.startswith('-r')]
 
-# Core requirements
-install_requires = read_requirements('requirements-minimal.txt')
-
 # Optional requirements
 extras_require = {
     'full': read_requirements('requirements.txt'),
@@ -35,39 +31,4 @@ extras_require = {
     ]
 }
 
-setup(
-    name="options-wheel-strategy",
-    version="1.0.0",
-    author="Options Wheel Trader",
-    author_email="trader@example.com",
-    description="Algorithmic options wheel strategy trading system with backtesting",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/username/options-wheel-strategy",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Financial and Insurance Industry",
-        "Topic :: Office/Business :: Financial :: Investment",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-    ],
-    python_requires=">=3.9",
-    install_requires=install_requires,
-    extras_require=extras_require,
-    entry_points={
-        "console_scripts": [
-            "options-wheel=main:main",
-        ],
-    },
-    include_package_data=True,
-    package_data={
-        "": ["config/*.yaml", "*.md"],
-    },
-    zip_safe=False,
-)
\ No newline at end of file
+setup(extras_require=extras_require)
@@ -3,6 +3,7 @@
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date, timedelta
 import hashlib
+import threading
 import time
 import pandas as pd
 import structlog
@@ -26,12 +27,46 @@ from tenacity import (
 )
 import requests
 import requests.exceptions
+from requests.adapters import HTTPAdapter
 
 from ..utils.config import Config
 from ..utils.option_symbols import parse_option_symbol
 
 logger = structlog.get_logger(__name__)
 
+# Keep-alive connections per host in the shared pool. Sized above the put
+# scan's worker count (PUT_SCAN_WORKERS) plus the calling thread, so no
+# scan thread ever waits on, or discards, a connection.
+_HTTP_POOL_SIZE = 16
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def _shared_http_session() -> requests.Session:
+    """The process-wide HTTP session every Alpaca SDK client sends through.
+
+    The SDK opens a fresh ``Session`` per client, and the Cloud Run server
+    builds an ``AlpacaClient`` per request, so each request used to pay new
+    TCP + TLS handshakes. Auth headers are set per request by the SDK, so
+    one session is safe to share across clients and credentials.
+
+    Shared across threads too (the put scan's chain-fetch pool). That relies
+    on the SDK using the session only for ``Session.request``: no cookies,
+    no per-session auth or header mutation, so the only shared state is
+    urllib3's connection pool, which is thread-safe. Both hold for the
+    ``RESTClient`` in alpaca-py 0.44.0 (``self._session = Session()`` in
+    ``__init__``, read only by ``_one_request``); recheck on an SDK upgrade.
+    """
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_HTTP_POOL_SIZE)
+            session.mount('https://', adapter)
+            _http_session = session
+        return _http_session
+
 
 class CircuitBreaker:
     """Simple circuit breaker for API calls.
@@ -213,6 +248,18 @@ class AlpacaClient:
             api_key=config.alpaca_api_key,
             secret_key=config.alpaca_secret_key
         )
+
+        # Swap each SDK client's private Session for the shared pool, but only
+        # where the SDK still has one; otherwise it keeps its own transport.
+        session = _shared_http_session()
+        for sdk_client in (self.trading_client, self.stock_data_client, self.option_data_client):
+            if isinstance(getattr(sdk_client, '_session', None), requests.Session):
+                sdk_client._session = session
+            else:
+                logger.warning("Alpaca SDK client has no requests session to pool",
+                               event_category="system",
+                               event_type="http_pool_unavailable",
+                               sdk_client=type(sdk_client).__name__)
         
         logger.info("Alpaca client initialized",
                    event_category="system",
@@ -344,24 +391,59 @@ class AlpacaClient:
                 feed='iex'  # Real-time quotes from IEX exchange (FREE)
             )
             quotes = self.stock_data_client.get_stock_latest_quote(request)
-            quote = quotes[symbol]
+            return self._format_stock_quote(symbol, quotes[symbol])
+        except Exception as e:
+            logger.error("Failed to get stock quote",
+                        event_category="error",
+                        event_type="stock_quote_error",
+                        symbol=symbol,
+                        error=str(e))
+            raise
+
+    @api_retry
+    def get_stock_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get latest IEX quotes for several stocks in one request.
+
+        Same feed and shape as ``get_stock_quote``, one round trip for the
+        whole list. Symbols Alpaca returns no quote for are omitted.
 
+        Args:
+            symbols: Stock symbols
+
+        Returns:
+            Dict of symbol -> quote data
+        """
+        if not symbols:
+            return {}
+        try:
+            request = StockLatestQuoteRequest(
+                symbol_or_symbols=list(symbols),
+                feed='iex'
+            )
+            quotes = self.stock_data_client.get_stock_latest_quote(request)
             return {
-                'symbol': symbol,
-                'bid': float(quote.bid_price),
-                'ask': float(quote.ask_price),
-                'bid_size': int(quote.bid_size),
-                'ask_size': int(quote.ask_size),
-                'timestamp': quote.timestamp
+                symbol: self._format_stock_quote(symbol, quotes[symbol])
+                for symbol in symbols if symbol in quotes
             }
         except Exception as e:
-            logger.error("Failed to get stock quote",
+            logger.error("Failed to get stock quotes",
                         event_category="error",
                         event_type="stock_quote_error",
-                        symbol=symbol,
+                        symbols=list(symbols),
                         error=str(e))
             raise
 
+    @staticmethod
+    def _format_stock_quote(symbol: str, quote: Any) -> Dict[str, Any]:
+        return {
+            'symbol': symbol,
+            'bid': float(quote.bid_price),
+            'ask': float(quote.ask_price),
+            'bid_size': int(quote.bid_size),
+            'ask_size': int(quote.ask_size),
+            'timestamp': quote.timestamp
+        }
+
     def get_option_quote(self, option_symbol: str) -> Dict[str, Any]:
         """Get latest bid/ask quote for a specific option contract.
 
@@ -432,22 +514,7 @@ class AlpacaClient:
             )
 
             bars = self.stock_data_client.get_stock_bars(request)
-
-            # Convert to DataFrame
-            data = []
-            for bar in bars[symbol]:
-                data.append({
-                    'timestamp': bar.timestamp,
-                    'open': float(bar.open),
-                    'high': float(bar.high),
-                    'low': float(bar.low),
-                    'close': float(bar.close),
-                    'volume': int(bar.volume)
-                })
-
-            df = pd.DataFrame(data)
-            df.set_index('timestamp', inplace=True)
-            return df
+            return self._bars_frame(bars[symbol])
 
         except Exception as e:
             logger.error("Failed to get stock bars",
@@ -457,6 +524,64 @@ class AlpacaClient:
                         error=str(e))
             raise
     
+    @api_retry
+    def get_stock_bars_bulk(self, symbols: List[str], days: int = 30) -> Dict[str, pd.DataFrame]:
+        """Get daily bars for several stocks in one request.
+
+        Same feed, window and frame shape as ``get_stock_bars``, one round trip
+        for the whole list. Symbols Alpaca returns no bars for are omitted.
+
+        Args:
+            symbols: Stock symbols
+            days: Number of days of history
+
+        Returns:
+            Dict of symbol -> DataFrame with OHLCV data
+        """
+        if not symbols:
+            return {}
+        try:
+            end_date = datetime.now() - timedelta(minutes=20)
+            start_date = end_date - timedelta(days=days)
+
+            request = StockBarsRequest(
+                symbol_or_symbols=list(symbols),
+                timeframe=TimeFrame.Day,
+                start=start_date,
+                end=end_date
+            )
+
+            bars = self.stock_data_client.get_stock_bars(request)
+            return {
+                symbol: self._bars_frame(bars.data[symbol])
+                for symbol in symbols if bars.data.get(symbol)
+            }
+
+        except Exception as e:
+            logger.error("Failed to get stock bars",
+                        event_category="error",
+                        event_type="stock_bars_error",
+                        symbols=list(symbols),
+                        error=str(e))
+            raise
+
+    @staticmethod
+    def _bars_frame(bars: Any) -> pd.DataFrame:
+        data = []
+        for bar in bars:
+            data.append({
+                'timestamp': bar.timestamp,
+                'open': float(bar.open),
+                'high': float(bar.high),
+                'low': float(bar.low),
+                'close': float(bar.close),
+                'volume': int(bar.volume)
+            })
+
+        df = pd.DataFrame(data)
+        df.set_index('timestamp', inplace=True)
+        return df
+
     @api_retry
     def get_options_chain(self, underlying_symbol: str) -> List[Dict[str, Any]]:
         """Get options chain for a stock.
@@ -2,6 +2,7 @@
 
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import date, datetime, timedelta
+import heapq
 import pandas as pd
 import numpy as np
 import structlog
@@ -31,6 +32,19 @@ _DEFAULT_CACHE_TTL = timedelta(seconds=300)
 _coerce_date = coerce_expiry_date
 
 
+def _rank_by_return_score(options: List[Dict[str, Any]],
+                          limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Options by descending ``return_score``, ties in chain order.
+
+    With ``limit`` only the top N are selected, in the same order a full sort
+    would give them, without sorting the rest.
+    """
+    key = lambda o: o.get('return_score', 0)
+    if limit is None:
+        return sorted(options, key=key, reverse=True)
+    return heapq.nlargest(limit, options, key=key)
+
+
 class MarketDataManager:
     """Manager for market data operations and analysis."""
 
@@ -53,7 +67,9 @@ class MarketDataManager:
         # List[...] return type, so no caller or test has to change shape.
         self.last_call_rejection_stats: Dict[str, Dict[str, int]] = {}
         
-    def get_stock_metrics(self, symbol: str) -> Dict[str, Any]:
+    def get_stock_metrics(self, symbol: str,
+                          quote: Optional[Dict[str, Any]] = None,
+                          bars: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """Get comprehensive stock metrics for wheel strategy evaluation.
 
         Results are cached for up to 5 minutes to avoid repeated API calls
@@ -61,27 +77,31 @@ class MarketDataManager:
 
         Args:
             symbol: Stock symbol
+            quote: Quote already fetched for ``symbol`` (e.g. by a batched
+                request); fetched on demand when None
+            bars: 30-day daily bars already fetched for ``symbol``; fetched
+                on demand when None
 
         Returns:
             Dictionary with stock metrics
         """
         try:
             # Check cache first
-            cached = self._metrics_cache.get(symbol)
+            cached = self._fresh_metrics(symbol)
             if cached is not None:
-                value, ts = cached
-                if clock.now() - ts < self._cache_ttl:
-                    logger.debug("Using cached stock metrics",
-                                event_category="data",
-                                event_type="stock_metrics_cache_hit",
-                                symbol=symbol)
-                    return value
+                logger.debug("Using cached stock metrics",
+                            event_category="data",
+                            event_type="stock_metrics_cache_hit",
+                            symbol=symbol)
+                return cached
             # Get current quote
-            quote = self.alpaca.get_stock_quote(symbol)
+            if quote is None:
+                quote = self.alpaca.get_stock_quote(symbol)
             current_price = (quote['bid'] + quote['ask']) / 2
             
             # Get historical data for metrics calculation
-            bars = self.alpaca.get_stock_bars(symbol, days=30)
+            if bars is None:
+                bars = self.alpaca.get_stock_bars(symbol, days=30)
             
             if bars.empty:
                 logger.warning("No historical data available",
@@ -124,7 +144,71 @@ class MarketDataManager:
                         symbol=symbol,
                         error=str(e))
             return {}
+
+    def _fresh_metrics(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Cached metrics for ``symbol`` if still within the TTL, else None."""
+        cached = self._metrics_cache.get(symbol)
+        if cached is not None:
+            value, ts = cached
+            if clock.now() - ts < self._cache_ttl:
+                return value
+        return None
+
+    def _stale_symbols(self, symbols: List[str]) -> Optional[List[str]]:
+        """Symbols whose metrics are not cached, or None if too few to batch."""
+        stale = [s for s in symbols if self._fresh_metrics(s) is None]
+        return stale if len(stale) >= 2 else None
+
+    def _prefetch_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch quotes for every symbol not already cached in one request.
+
+        A failed batch is not fatal: each symbol then falls back to its own
+        ``get_stock_quote`` call inside ``get_stock_metrics``.
+        """
+        stale = self._stale_symbols(symbols)
+        if not stale:
+            return {}
+        try:
+            return self.alpaca.get_stock_quotes(stale)
+        except Exception as e:
+            logger.warning("Batched stock quote request failed, fetching per symbol",
+                          event_category="data",
+                          event_type="batch_quote_failed",
+                          symbols=stale,
+                          error=str(e))
+            return {}
+
+    def _prefetch_bars(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        """Fetch 30-day bars for every symbol not already cached in one request.
+
+        Same fallback as ``_prefetch_quotes``: a symbol the batch failed on or
+        omitted gets its own ``get_stock_bars`` call.
+        """
+        stale = self._stale_symbols(symbols)
+        if not stale:
+            return {}
+        try:
+            return self.alpaca.get_stock_bars_bulk(stale, days=30)
+        except Exception as e:
+            logger.warning("Batched stock bars request failed, fetching per symbol",
+                          event_category="data",
+                          event_type="batch_bars_failed",
+                          symbols=stale,
+                          error=str(e))
+            return {}
     
+    def prefetch_stock_metrics(self, symbols: List[str]) -> None:
+        """Warm the metrics cache for ``symbols`` with one quote and one bars request.
+
+        For callers that go on to read ``get_stock_metrics`` symbol by symbol.
+        A symbol the batches miss is left for that call to fetch on its own.
+        """
+        quotes = self._prefetch_quotes(symbols)
+        bars = self._prefetch_bars(symbols)
+        for symbol in symbols:
+            if symbol in quotes and symbol in bars:
+                self.get_stock_metrics(symbol, quote=quotes[symbol], bars=bars[symbol])
+
     def filter_suitable_stocks(self, symbols: List[str]) -> List[Dict[str, Any]]:
         """Filter stocks suitable for wheel strategy.
 
@@ -136,9 +220,12 @@ class MarketDataManager:
         """
         suitable_stocks = []
         rejected_stocks = []
+        quotes = self._prefetch_quotes(symbols)
+        bars = self._prefetch_bars(symbols)
 
         for symbol in symbols:
-            metrics = self.get_stock_metrics(symbol)
+            metrics = self.get_stock_metrics(symbol, quote=quotes.get(symbol),
+                                             bars=bars.get(symbol))
             if metrics and metrics.get('suitable_for_wheel', False):
                 suitable_stocks.append(metrics)
                 logger.info("Stock passed price/volume filter",
@@ -221,6 +308,9 @@ class MarketDataManager:
             calls = []
             
             now = clock.now()
+            # A chain has only a handful of distinct expirations; parse each
+            # one once rather than once per contract.
+            dte_by_expiry: Dict[Any, int] = {}
             
             for option in options_chain:
                 # Calculate days to expiration
@@ -230,10 +320,12 @@ class MarketDataManager:
                 if exp_date is None:
                     continue
 
-                if isinstance(exp_date, str):
-                    exp_date = datetime.fromisoformat(exp_date.replace('Z', '+00:00'))
-
-                dte = (exp_date - now).days
+                dte = dte_by_expiry.get(exp_date)
+                if dte is None:
+                    parsed = exp_date
+                    if isinstance(parsed, str):
+                        parsed = datetime.fromisoformat(parsed.replace('Z', '+00:00'))
+                    dte = dte_by_expiry[exp_date] = (parsed - now).days
                 
                 # Calculate mid price
                 if option['bid'] > 0 and option['ask'] > 0:
@@ -340,11 +432,11 @@ class MarketDataManager:
 
                 suitable_puts.append(put)
 
-        # Sort by return score (higher is better)
-        suitable_puts.sort(key=lambda x: x.get('return_score', 0), reverse=True)
+        # Rank by return score (higher is better); only the top 5 are returned
+        ranked_puts = _rank_by_return_score(suitable_puts, limit=5)
 
-        if suitable_puts:
-            best_put = suitable_puts[0]
+        if ranked_puts:
+            best_put = ranked_puts[0]
             logger.info("STAGE 7 COMPLETE: Options chain criteria - puts found",
                        event_category="filtering",
                        event_type="stage_7_complete_found",
@@ -387,7 +479,7 @@ class MarketDataManager:
                        rejected_max_premium=round(max_premium, 2),
                        rejected_dte_range=f"{min_dte}-{max_dte}")
 
-        return suitable_puts[:5]  # Return top 5
+        return ranked_puts  # Top 5
     
     def find_suitable_calls(self, symbol: str, min_strike_price: float = 0.0,
                             exclude_expiry_on_or_after: Optional[date] = None,
@@ -612,16 +704,21 @@ class MarketDataManager:
 
                 suitable_calls.append(call)
 
-        # Sort by return score (higher is better)
-        suitable_calls.sort(key=lambda x: x.get('return_score', 0), reverse=True)
+        # Rank by return score (higher is better). The entry path keeps its
+        # top-5 slice, byte-identical. The roll path gets the full legal set:
+        # FC-078 DD-3 ranks by net credit, and slicing by the entry-shaped
+        # ``return_score`` first would hide exactly the near-money, high-credit
+        # replacements a defensive roll wants.
+        ranked_calls = _rank_by_return_score(
+            suitable_calls, limit=None if criteria_profile == 'roll' else 5)
 
         # FC-065 Phase 4: publish the breakdown for the decision record. Same
         # numbers the STAGE 8 log line carries, but reachable by the caller
         # instead of only by log archaeology.
         self.last_call_rejection_stats[symbol] = dict(rejection_stats)
 
-        if suitable_calls:
-            best_call = suitable_calls[0]
+        if ranked_calls:
+            best_call = ranked_calls[0]
             logger.info("STAGE 8 COMPLETE: Call options criteria - calls found",
                        event_category="filtering",
                        event_type="stage_8_complete_found",
@@ -672,13 +769,7 @@ class MarketDataManager:
                        rejected_max_premium=round(max_premium, 2),
                        rejected_dte_range=f"{min_dte}-{max_dte}")
 
-        # The entry path keeps its top-5 slice, byte-identical. The roll path
-        # gets the full legal set: FC-078 DD-3 ranks by net credit, and slicing
-        # by the entry-shaped ``return_score`` first would hide exactly the
-        # near-money, high-credit replacements a defensive roll wants.
-        if criteria_profile == 'roll':
-            return suitable_calls
-        return suitable_calls[:5]  # Return top 5
+        return ranked_calls
 
     def _validate_option_data(self, option: Dict[str, Any]) -> tuple:
         """Validate option data before processing.
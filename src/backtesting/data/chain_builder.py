@@ -17,10 +17,12 @@ Correctness contract (enforced by tests):
 from __future__ import annotations
 
 import hashlib
+import math
 from dataclasses import dataclass, field
 from datetime import date
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+import numpy as np
 import structlog
 
 from . import greeks
@@ -59,7 +61,9 @@ STRIKE_WINDOW_PCT = 0.25
 
 # Version of the cached-quote *derivation*. Bump to invalidate every existing
 # cache entry when the maths changes rather than its inputs.
-_FINGERPRINT_SCHEMA = "v1"
+# v2: IV/delta solved by the array forms in ``greeks`` (scipy ``ndtr`` in place
+# of the erf-based CDF) — agrees with v1 to solver tolerance, not bit-for-bit.
+_FINGERPRINT_SCHEMA = "v2"
 
 
 def strike_window(
@@ -153,10 +157,28 @@ class ChainSnapshot:
     underlying_price: float
     puts: List[ChainQuote] = field(default_factory=list)
     calls: List[ChainQuote] = field(default_factory=list)
+    # symbol -> quote, built once in __post_init__; see quote()
+    _by_symbol: Dict[str, ChainQuote] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        index: Dict[str, ChainQuote] = {}
+        for q in self.all_quotes():
+            index.setdefault(q.symbol, q)  # first match wins, as a scan would
+        object.__setattr__(self, "_by_symbol", index)
 
     def all_quotes(self) -> List[ChainQuote]:
         return [*self.puts, *self.calls]
 
+    def quote(self, symbol: str) -> Optional[ChainQuote]:
+        """The quote for one OCC symbol, or None if it did not trade that day.
+
+        Positions are marked and orders filled by symbol every simulated day,
+        so the lookup is indexed once, at construction, instead of scanning
+        the chain each time. A snapshot is a point-in-time record: build a new
+        one (``dataclasses.replace``) rather than editing its quote lists.
+        """
+        return self._by_symbol.get(symbol)
+
 
 class ChainBuilder:
     """Builds ChainSnapshots from a data provider + spread model."""
@@ -326,31 +348,36 @@ class ChainBuilder:
         puts: List[ChainQuote] = []
         calls: List[ChainQuote] = []
 
+        # Gather the contracts that traded, then solve IV and delta for all of
+        # them in one array pass.
+        priced = []
         for c in contracts:
             day_bars = bars_by_symbol.get(c.symbol)
             if not day_bars:
                 continue  # no trade that day -> no usable price -> not in chain
             bar = day_bars[0]
-            mark = bar.close
-            if mark <= 0:
+            if bar.close <= 0:
                 continue
-
             dte = (c.expiration - as_of).days
             if dte < 0:
                 continue
-            T = greeks.year_fraction(dte)
-            iv = greeks.implied_vol(
-                mark, underlying_price, c.strike, T, self._r, q, c.option_type
-            )
-            delta = (
-                greeks.bs_delta(
-                    underlying_price, c.strike, T, self._r, iv, q, c.option_type
-                )
-                if iv is not None
-                else None
-            )
-            moneyness = abs(1.0 - c.strike / underlying_price)
-            bid, ask = self._spread.bid_ask(mark, moneyness)
+            priced.append((c, bar, dte))
+        if not priced:
+            return ChainSnapshot(underlying, as_of, underlying_price)
+
+        marks = np.array([bar.close for _, bar, _ in priced])
+        strikes = np.array([c.strike for c, _, _ in priced])
+        T = np.array([greeks.year_fraction(dte) for _, _, dte in priced])
+        is_call = np.array([c.option_type.lower() == "call" for c, _, _ in priced])
+
+        ivs = greeks.implied_vol_vec(marks, underlying_price, strikes, T, self._r, q, is_call)
+        deltas = greeks.bs_delta_vec(underlying_price, strikes, T, self._r, ivs, q, is_call)
+        bids, asks = self._spread.bid_ask_vec(marks, np.abs(1.0 - strikes / underlying_price))
+
+        for (c, bar, dte), iv, delta, bid, ask in zip(
+            priced, ivs.tolist(), deltas.tolist(), bids.tolist(), asks.tolist()
+        ):
+            mark = bar.close
 
             quote = ChainQuote(
                 symbol=c.symbol,
@@ -364,8 +391,8 @@ class ChainBuilder:
                 mark=mark,
                 bid=bid,
                 ask=ask,
-                implied_volatility=iv,
-                delta=delta,
+                implied_volatility=None if math.isnan(iv) else iv,
+                delta=None if math.isnan(delta) else delta,
                 volume=bar.volume,
             )
             (puts if c.option_type == "put" else calls).append(quote)
@@ -13,13 +13,22 @@ Two honest caveats, surfaced wherever these values are used:
   * European BS is a fine approximation for the short-dated OTM options the
     wheel sells; it misprices deep-ITM American options near a dividend. The
     engine handles early exercise separately in the broker, not here.
+
+Each scalar function has an array twin (``*_vec``) that evaluates a whole
+chain in one NumPy pass. ``ChainBuilder`` uses the array forms; the scalar ones
+remain the reference the array forms are tested against.
 """
 
 from __future__ import annotations
 
 import math
 
-# Standard normal CDF and PDF (avoid a scipy dependency for such simple math).
+import numpy as np
+from scipy.special import ndtr
+
+# Standard normal CDF and PDF for the scalar path. ``math.erf`` keeps the
+# per-contract calls free of NumPy/SciPy dispatch; the array forms below use
+# scipy's ``ndtr``.
 
 
 def _norm_cdf(x: float) -> float:
@@ -162,3 +171,119 @@ def year_fraction(dte_days: int, *, basis: float = 365.0) -> float:
     day itself from collapsing T to exactly zero mid-simulation.
     """
     return max(dte_days, 0.5) / basis
+
+
+# --------------------------------------------------------------------------- #
+# Array forms
+# --------------------------------------------------------------------------- #
+# Same formulas and edge cases as the scalar functions, over equal-length 1-D
+# arrays (scalars broadcast). ``is_call`` is a boolean array; "no IV" is NaN
+# rather than None. The normal CDF is scipy's ``ndtr`` ufunc — there is no
+# vectorized erf in NumPy itself.
+
+
+def bs_price_vec(S, K, T, r, sigma, q, is_call) -> np.ndarray:
+    """Array form of ``bs_price``; intrinsic value where T/sigma/S/K <= 0."""
+    S, K, T, sigma = (np.asarray(a, dtype=float) for a in (S, K, T, sigma))
+    is_call = np.asarray(is_call, dtype=bool)
+    valid = (T > 0) & (sigma > 0) & (S > 0) & (K > 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vol_sqrt_t = sigma * np.sqrt(T)
+        d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / vol_sqrt_t
+        d2 = d1 - vol_sqrt_t
+        disc_r = np.exp(-r * T)
+        disc_q = np.exp(-q * T)
+        call = S * disc_q * ndtr(d1) - K * disc_r * ndtr(d2)
+        put = K * disc_r * ndtr(-d2) - S * disc_q * ndtr(-d1)
+
+    intrinsic = np.maximum(0.0, np.where(is_call, S - K, K - S))
+    return np.where(valid, np.where(is_call, call, put), intrinsic)
+
+
+def bs_delta_vec(S, K, T, r, sigma, q, is_call) -> np.ndarray:
+    """Array form of ``bs_delta``; terminal delta where T/sigma/S/K <= 0.
+
+    A NaN ``sigma`` (unsolved IV) yields a NaN delta.
+    """
+    S, K, T, sigma = (np.asarray(a, dtype=float) for a in (S, K, T, sigma))
+    is_call = np.asarray(is_call, dtype=bool)
+    valid = (T > 0) & (sigma > 0) & (S > 0) & (K > 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * np.sqrt(T))
+        disc_q = np.exp(-q * T)
+        delta = np.where(is_call, disc_q * ndtr(d1), -disc_q * ndtr(-d1))
+
+    terminal = np.where(is_call, (S > K).astype(float), -(S < K).astype(float))
+    out = np.where(valid, delta, terminal)
+    return np.where(np.isnan(sigma), np.nan, out)
+
+
+def implied_vol_vec(
+    price,
+    S,
+    K,
+    T,
+    r: float,
+    q: float,
+    is_call,
+    *,
+    lo: float = 1e-4,
+    hi: float = 5.0,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """Array form of ``implied_vol``: the same bisection run on every contract
+    at once. Each element stops moving as soon as it converges, so the result
+    matches the scalar solver element for element. NaN where it returns None.
+    """
+    price, S, K, T = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (price, S, K, T)))
+    is_call = np.broadcast_to(np.asarray(is_call, dtype=bool), price.shape)
+    out = np.full(price.shape, np.nan)
+
+    usable = (price > 0) & (T > 0) & (S > 0) & (K > 0)
+    hi_price = bs_price_vec(S, K, T, r, hi, q, is_call)
+    lo_price = bs_price_vec(S, K, T, r, lo, q, is_call)
+
+    # At or below the lowest-vol price: ~zero vol if within tol, else no IV.
+    at_floor = usable & (price <= lo_price)
+    out[at_floor & (np.abs(price - lo_price) <= tol)] = lo
+    # Above the highest-vol price in the bracket stays NaN.
+    active = usable & ~at_floor & (price < hi_price)
+
+    # Bisect only the contracts still searching. Everything that does not
+    # depend on the trial vol is computed once, and converged contracts are
+    # dropped from the working arrays each round.
+    idx = np.flatnonzero(active)
+    target, call = price[idx], is_call[idx]
+    S_, K_, T_ = S[idx], K[idx], T[idx]
+    log_sk = np.log(S_ / K_)
+    sqrt_t = np.sqrt(T_)
+    s_disc_q = S_ * np.exp(-q * T_)
+    k_disc_r = K_ * np.exp(-r * T_)
+    a = np.full(idx.shape, lo)
+    b = np.full(idx.shape, hi)
+    for _ in range(max_iter):
+        if not idx.size:
+            break
+        mid = 0.5 * (a + b)
+        vol_sqrt_t = mid * sqrt_t
+        d1 = (log_sk + (r - q + 0.5 * mid * mid) * T_) / vol_sqrt_t
+        d2 = d1 - vol_sqrt_t
+        p = np.where(
+            call,
+            s_disc_q * ndtr(d1) - k_disc_r * ndtr(d2),
+            k_disc_r * ndtr(-d2) - s_disc_q * ndtr(-d1),
+        )
+        hit = np.abs(p - target) < tol
+        out[idx[hit]] = mid[hit]
+        above = p > target
+        b = np.where(above, mid, b)
+        a = np.where(above, a, mid)
+        keep = ~hit
+        idx, target, call, T_, log_sk, sqrt_t, s_disc_q, k_disc_r, a, b = (
+            x[keep] for x in (idx, target, call, T_, log_sk, sqrt_t, s_disc_q, k_disc_r, a, b)
+        )
+    out[idx] = 0.5 * (a + b)
+    return out
@@ -22,6 +22,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class SpreadModel:
@@ -72,6 +74,14 @@ class SpreadModel:
         hs = self.half_spread(mark, moneyness)
         return max(0.0, mark - hs), mark + hs
 
+    def bid_ask_vec(self, marks, moneyness) -> tuple[np.ndarray, np.ndarray]:
+        """Array form of ``bid_ask``: the same arithmetic as masks, not branches."""
+        marks = np.asarray(marks, dtype=float)
+        frac = self.base_frac + self.otm_widening * np.maximum(0.0, moneyness)
+        frac = np.where(marks < self.cheap_threshold, frac + self.cheap_widening, frac)
+        hs = np.where(marks > 0, np.maximum(self.abs_floor, frac * marks), self.abs_floor)
+        return np.maximum(0.0, marks - hs), marks + hs
+
     @classmethod
     def calibrate(cls, samples: list[dict], *, return_diagnostics: bool = False):
         """Fit a SpreadModel from real live-chain snapshots.
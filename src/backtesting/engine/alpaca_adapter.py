@@ -26,6 +26,7 @@ than production and silently inflate the opportunity set.
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from datetime import date, datetime, time, timedelta
 from typing import Any, Dict, List, Optional
 
@@ -86,7 +87,15 @@ class BacktestAlpacaClient:
         """
         self._broker = broker
         self._chains = chains
-        self._stock_bars = stock_bars
+        self._stock_bars = {
+            symbol: sorted(bars, key=lambda b: b.bar_date)
+            for symbol, bars in stock_bars.items()
+        }
+        # Parallel date lists, so "bars up to today" is a bisect rather than a
+        # scan of the whole history on every call of every simulated day.
+        self._bar_dates = {
+            symbol: [b.bar_date for b in bars] for symbol, bars in self._stock_bars.items()
+        }
         self._options_approved_level = options_approved_level
 
         self._orders: Dict[str, Dict[str, Any]] = {}
@@ -115,10 +124,8 @@ class BacktestAlpacaClient:
         snap = self._snapshot(underlying)
         if snap is not None:
             return snap.underlying_price
-        for bar in reversed(self._stock_bars.get(underlying, [])):
-            if bar.bar_date <= self.today:
-                return bar.close
-        return None
+        upto = bisect_right(self._bar_dates.get(underlying, []), self.today)
+        return self._stock_bars[underlying][upto - 1].close if upto else None
 
     # ------------------------------------------------------------------ #
     # Account & positions
@@ -234,6 +241,16 @@ class BacktestAlpacaClient:
             "timestamp": self.today.isoformat(),
         }
 
+    def get_stock_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        # The batched form of get_stock_quote; symbols with no close are
+        # omitted, as the live client omits symbols Alpaca has no quote for.
+        out = {}
+        for symbol in symbols:
+            quote = self.get_stock_quote(symbol)
+            if quote:
+                out[symbol] = quote
+        return out
+
     def get_stock_bars(self, symbol: str, days: int = 30) -> pd.DataFrame:
         """Daily OHLCV up to and including the simulated date. Never beyond it.
 
@@ -250,12 +267,9 @@ class BacktestAlpacaClient:
         and with the longer window NVDA measured 18.6% against a 15% limit and
         was blocked for all of Nov 2025, while live traded it on 7 days.
         """
-        cutoff = self.today - timedelta(days=days) if days else None
-        bars = [
-            b
-            for b in self._stock_bars.get(symbol, [])
-            if b.bar_date <= self.today and (cutoff is None or b.bar_date > cutoff)
-        ]
+        dates = self._bar_dates.get(symbol, [])
+        lo = bisect_right(dates, self.today - timedelta(days=days)) if days else 0
+        bars = self._stock_bars.get(symbol, [])[lo:bisect_right(dates, self.today)]
         if not bars:
             return pd.DataFrame()
         index = pd.DatetimeIndex(
@@ -272,6 +286,16 @@ class BacktestAlpacaClient:
             index=index,
         )
 
+    def get_stock_bars_bulk(self, symbols: List[str], days: int = 30) -> Dict[str, pd.DataFrame]:
+        # The batched form of get_stock_bars; symbols with no bars in the
+        # window are omitted, as the live client omits ones Alpaca has none for.
+        out = {}
+        for symbol in symbols:
+            frame = self.get_stock_bars(symbol, days=days)
+            if not frame.empty:
+                out[symbol] = frame
+        return out
+
     def get_options_chain(self, underlying_symbol: str) -> List[Dict[str, Any]]:
         snap = self._snapshot(underlying_symbol)
         if snap is None:
@@ -513,10 +537,7 @@ class BacktestAlpacaClient:
 def _find_quote(snap: Optional[ChainSnapshot], symbol: str):
     if snap is None:
         return None
-    for quote in snap.all_quotes():
-        if quote.symbol == symbol:
-            return quote
-    return None
+    return snap.quote(symbol)
 
 
 def _parse_expiration(parsed: Dict[str, Any]) -> date:
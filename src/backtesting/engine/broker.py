@@ -22,6 +22,7 @@ Conventions:
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import date
 from typing import Dict, List, Optional
@@ -32,8 +33,13 @@ logger = structlog.get_logger(__name__)
 
 ITM_THRESHOLD = 0.01  # OCC auto-exercise: in the money by >= 1 cent
 
+# A long replay creates one LedgerEvent per fill, settlement and dividend, and
+# positions are read on every simulated day; slotted records are smaller and
+# faster to read. ``slots=`` needs Python 3.10+.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class StockLot:
     """A lot of shares acquired at one cost basis (FIFO for disposal)."""
 
@@ -43,7 +49,7 @@ class StockLot:
     acquired: date
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OptionPosition:
     """A short option position."""
 
@@ -58,7 +64,7 @@ class OptionPosition:
     opened: date
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LedgerEvent:
     """One money/position event, for audit and metrics."""
 
@@ -48,6 +48,7 @@ production too — which is the entire point of FC-032.
 from __future__ import annotations
 
 import copy
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import Any, Dict, List, Optional, Sequence
@@ -89,10 +90,7 @@ def _find_chain_quote(snapshot: Optional[ChainSnapshot], symbol: str):
     """The quote for one OCC symbol in a snapshot, or None if it did not trade."""
     if snapshot is None:
         return None
-    for quote in snapshot.all_quotes():
-        if quote.symbol == symbol:
-            return quote
-    return None
+    return snapshot.quote(symbol)
 
 
 def restrict_symbols(config: Config, symbols: Sequence[str]) -> Config:
@@ -182,6 +180,7 @@ class Simulator:
         warmup_calendar_days: int = 60,
         earnings_calendar: Optional[object] = None,
         dividend_schedule: Optional[DividendSchedule] = None,
+        chain_workers: int = 1,
     ) -> None:
         self.config = restrict_symbols(config, symbols)
         self.provider = provider
@@ -219,6 +218,11 @@ class Simulator:
         if dividend_schedule is None:
             dividend_schedule = load_default_schedule()
         self.dividends = dividend_schedule
+        # Chains are independent per (symbol, day) and a cold build is two
+        # network round trips, so they can be fetched concurrently. 1 keeps the
+        # build serial (tests, fake providers); the result is identical either
+        # way because chains are assembled in day order after the fan-out.
+        self.chain_workers = max(1, int(chain_workers))
 
     # ------------------------------------------------------------------ #
     # Data loading
@@ -245,25 +249,36 @@ class Simulator:
     def _build_chains(
         self, stock_bars: Dict[str, List[StockBar]], days: Sequence[date]
     ) -> Dict[str, Dict[date, ChainSnapshot]]:
-        chains: Dict[str, Dict[date, ChainSnapshot]] = {}
+        jobs = []
         for symbol in self.symbols:
             closes = {b.bar_date: b.close for b in stock_bars.get(symbol, [])}
             ceiling, floor = self._strike_anchors(stock_bars.get(symbol, []))
-            per_day: Dict[date, ChainSnapshot] = {}
             for day in days:
                 if day not in closes:
                     continue  # symbol did not trade that session
-                snap = self.builder.build(
-                    symbol,
-                    day,
-                    self.max_dte,
-                    underlying_price=closes[day],
-                    cost_basis=ceiling,
-                    low_anchor=floor,
-                )
-                if snap is not None:
-                    per_day[day] = snap
-            chains[symbol] = per_day
+                jobs.append((symbol, day, closes[day], ceiling, floor))
+
+        def build(job):
+            symbol, day, close, ceiling, floor = job
+            return self.builder.build(
+                symbol,
+                day,
+                self.max_dte,
+                underlying_price=close,
+                cost_basis=ceiling,
+                low_anchor=floor,
+            )
+
+        if self.chain_workers > 1 and len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=self.chain_workers) as pool:
+                snaps = list(pool.map(build, jobs))
+        else:
+            snaps = [build(job) for job in jobs]
+
+        chains: Dict[str, Dict[date, ChainSnapshot]] = {s: {} for s in self.symbols}
+        for (symbol, day, *_), snap in zip(jobs, snaps):
+            if snap is not None:
+                chains[symbol][day] = snap
         return chains
 
     def _strike_anchors(
@@ -38,6 +38,9 @@ BID_FILL_HAIRCUT = 1.0
 # include it: changing it changes verdicts, and a verdict must not be
 # indistinguishable from one produced under a different fill model.
 DEFAULT_FILL_HAIRCUT = 0.25
+# Concurrent chain builds per replay. Cold builds are network-bound; the SDK
+# retries a 429, and a warm cache makes this a no-op.
+CHAIN_WORKERS = 8
 
 
 def evaluate_symbol(
@@ -51,6 +54,7 @@ def evaluate_symbol(
     run_sensitivity: bool = True,
     chain_store: Optional[ChainStore] = None,
     use_cache: bool = True,
+    chain_workers: int = CHAIN_WORKERS,
 ) -> tuple:
     """Replay ``symbol`` and score it.
 
@@ -58,6 +62,9 @@ def evaluate_symbol(
         chain_store: parquet chain cache to use; defaults to one rooted at
             ``cache/backtest/`` (gitignored).
         use_cache: set False to force every chain to be rebuilt from the API.
+        chain_workers: concurrent chain builds inside each replay. The screen
+            lowers it when several replays run at once, so the run as a whole
+            keeps to ``CHAIN_WORKERS`` requests in flight.
 
     Returns:
         ``(FitnessReport, sensitivity_dict_or_None)``.
@@ -81,7 +88,7 @@ def evaluate_symbol(
     result = _run(
         symbol, start, end, config, provider, builder,
         starting_cash=starting_cash, fill_haircut=fill_haircut, max_dte=max_dte,
-        dividends=dividends,
+        dividends=dividends, chain_workers=chain_workers,
     )
     report = _score(symbol, result, provider, starting_cash, dividends)
 
@@ -90,7 +97,7 @@ def evaluate_symbol(
         bid_result = _run(
             symbol, start, end, config, provider, builder,
             starting_cash=starting_cash, fill_haircut=BID_FILL_HAIRCUT, max_dte=max_dte,
-            dividends=dividends,
+            dividends=dividends, chain_workers=chain_workers,
         )
         bid_report = _score(symbol, bid_result, provider, starting_cash, dividends)
         sensitivity = {
@@ -116,11 +123,12 @@ def _run(
     symbol: str, start: date, end: date, config, provider, builder, *,
     starting_cash: float, fill_haircut: float, max_dte: int,
     dividends: Optional[DividendSchedule] = None,
+    chain_workers: int = CHAIN_WORKERS,
 ) -> SimulationResult:
     simulator = Simulator(
         config, provider, builder, [symbol], start, end,
         starting_cash=starting_cash, max_dte=max_dte, fill_haircut=fill_haircut,
-        dividend_schedule=dividends,
+        dividend_schedule=dividends, chain_workers=chain_workers,
     )
     return simulator.run()
 
@@ -418,16 +418,24 @@ def compute_fitness(
         report.calls_sold += cycle.calls_sold
         report.assignments += 1 if cycle.assigned else 0
 
-    report.days_in_position = sum(
-        1 for d in daily if d.open_options > 0 or any(v > 0 for v in d.shares_held.values())
-    )
+    # One walk over the curve for the per-day tallies.
+    equity: List[float] = []
+    deployed_total, deployed_days, peak_collateral, days_in_position = 0.0, 0, None, 0
+    for d in daily:
+        equity.append(d.equity)
+        collateral = d.reserved_collateral
+        if peak_collateral is None or collateral > peak_collateral:
+            peak_collateral = collateral
+        if collateral > 0:
+            deployed_total += collateral
+            deployed_days += 1
+        if d.open_options > 0 or any(v > 0 for v in d.shares_held.values()):
+            days_in_position += 1
+    report.days_in_position = days_in_position
     report.unrealized_stock_pnl = _unrealized_stock_pnl(daily, cycles, benchmark_prices or {})
-    collaterals = [d.reserved_collateral for d in daily]
-    deployed = [c for c in collaterals if c > 0]
-    report.avg_collateral = sum(deployed) / len(deployed) if deployed else 0.0
-    report.peak_collateral = max(collaterals) if collaterals else 0.0
+    report.avg_collateral = deployed_total / deployed_days if deployed_days else 0.0
+    report.peak_collateral = peak_collateral
 
-    equity = [d.equity for d in daily]
     report.max_drawdown = _max_drawdown(equity)
     report.sharpe, report.sortino = _risk_ratios(equity)
     report.days_underwater = _days_underwater(daily, cycles, benchmark_prices or {})
@@ -19,6 +19,7 @@ between "this symbol is fine" and "this symbol was never checked".
 from __future__ import annotations
 
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import Dict, List, Optional, Sequence
@@ -27,7 +28,7 @@ import structlog
 
 from ..utils.config import Config
 from .data.alpaca_provider import ALPACA_OPTIONS_HISTORY_START, UnadjustedCorporateAction
-from .evaluate import evaluate_symbol
+from .evaluate import CHAIN_WORKERS, evaluate_symbol
 from .reporting.bq_writer import BacktestRunWriter, build_row, config_hash
 
 logger = structlog.get_logger(__name__)
@@ -106,6 +107,7 @@ def run_screen(
     starting_cash: float = 100_000.0,
     persist: bool = True,
     run_sensitivity: bool = True,
+    workers: int = 1,
 ) -> ScreenResult:
     """Evaluate every symbol and (optionally) persist the results.
 
@@ -119,6 +121,13 @@ def run_screen(
         persist: write to BigQuery.
         run_sensitivity: also replay at the bid. Doubles runtime; worth it,
             because a verdict that flips on the fill assumption is not a verdict.
+        workers: symbols replayed at once, each in its own process. A replay
+            swaps the module-level analytics writer and resets the execution
+            engine's failed-symbol registry, so two symbols cannot share a
+            process; separate processes share only the on-disk chain cache,
+            whose writes are atomic. Results keep universe order either way.
+            ``CHAIN_WORKERS`` is split across the processes, so a parallel
+            screen never has more chain requests in flight than one replay.
     """
     config = config or Config()
     universe = list(symbols or config.stock_symbols)
@@ -154,32 +163,28 @@ def run_screen(
 
     result = ScreenResult(run_id=run_id, start=start, end=end,
                           run_kind=run_kind, universe_size=len(universe))
-    for symbol in universe:
-        try:
-            report, sensitivity = evaluate_symbol(
-                symbol, start, end, config=config,
-                starting_cash=starting_cash, run_sensitivity=run_sensitivity,
-            )
-            result.results.append(SymbolResult(symbol, report, sensitivity))
-            logger.info("Screened symbol",
-                        event_category="backtest", event_type="screen_symbol_done",
-                        symbol=symbol, verdict=report.verdict(),
-                        total_return=round(report.total_return, 4))
-        except UnadjustedCorporateAction as exc:
-            # A split in the window is a data-scope limit, not a symbol verdict.
-            # Recording it as an error keeps it out of the demote list, where it
-            # would read as a judgement about the symbol.
-            result.results.append(SymbolResult(symbol, error=f"corporate_action: {exc}"))
-            logger.warning("Symbol skipped: unmodelled corporate action",
-                           event_category="backtest",
-                           event_type="screen_symbol_skipped",
-                           symbol=symbol, reason=str(exc)[:200])
-        except Exception as exc:  # noqa: BLE001 - one bad symbol must not kill the run
-            result.results.append(SymbolResult(symbol, error=str(exc)))
-            logger.error("Symbol FAILED during screen",
-                         event_category="backtest",
-                         event_type="screen_symbol_failed",
-                         symbol=symbol, error=str(exc)[:300])
+    if workers > 1 and len(universe) > 1:
+        processes = min(workers, len(universe))
+        chain_workers = max(1, CHAIN_WORKERS // processes)
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [
+                pool.submit(_screen_symbol, symbol, start, end, config,
+                            starting_cash, run_sensitivity, chain_workers)
+                for symbol in universe
+            ]
+            for symbol, future in zip(universe, futures):
+                try:
+                    result.results.append(future.result())
+                except Exception as exc:  # noqa: BLE001 - a dead worker is one symbol's failure
+                    result.results.append(SymbolResult(symbol, error=str(exc)))
+                    logger.error("Symbol FAILED during screen",
+                                 event_category="backtest",
+                                 event_type="screen_symbol_failed",
+                                 symbol=symbol, error=str(exc)[:300])
+    else:
+        for symbol in universe:
+            result.results.append(_screen_symbol(
+                symbol, start, end, config, starting_cash, run_sensitivity))
 
     if persist:
         rows = [
@@ -200,6 +205,44 @@ def run_screen(
     return result
 
 
+def _screen_symbol(
+    symbol: str,
+    start: date,
+    end: date,
+    config: Config,
+    starting_cash: float,
+    run_sensitivity: bool,
+    chain_workers: int = CHAIN_WORKERS,
+) -> SymbolResult:
+    """Evaluate one symbol; a failure becomes an error row, never an exception."""
+    try:
+        report, sensitivity = evaluate_symbol(
+            symbol, start, end, config=config,
+            starting_cash=starting_cash, run_sensitivity=run_sensitivity,
+            chain_workers=chain_workers,
+        )
+        logger.info("Screened symbol",
+                    event_category="backtest", event_type="screen_symbol_done",
+                    symbol=symbol, verdict=report.verdict(),
+                    total_return=round(report.total_return, 4))
+        return SymbolResult(symbol, report, sensitivity)
+    except UnadjustedCorporateAction as exc:
+        # A split in the window is a data-scope limit, not a symbol verdict.
+        # Recording it as an error keeps it out of the demote list, where it
+        # would read as a judgement about the symbol.
+        logger.warning("Symbol skipped: unmodelled corporate action",
+                       event_category="backtest",
+                       event_type="screen_symbol_skipped",
+                       symbol=symbol, reason=str(exc)[:200])
+        return SymbolResult(symbol, error=f"corporate_action: {exc}")
+    except Exception as exc:  # noqa: BLE001 - one bad symbol must not kill the run
+        logger.error("Symbol FAILED during screen",
+                     event_category="backtest",
+                     event_type="screen_symbol_failed",
+                     symbol=symbol, error=str(exc)[:300])
+        return SymbolResult(symbol, error=str(exc))
+
+
 def render_screen_summary(result: ScreenResult) -> str:
     """Operator-facing summary. Demotions are recommendations, not actions."""
     out: List[str] = []
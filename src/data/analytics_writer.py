@@ -396,6 +396,15 @@ def get_analytics_writer() -> AnalyticsWriter:
     return _instance
 
 
+def get_analytics_writer_override() -> Optional[AnalyticsWriter]:
+    """THIS thread's replay override, or None when the singleton is in effect.
+
+    For code that hands work to another thread and must carry the override
+    across: unlike ``get_analytics_writer`` it never builds the singleton.
+    """
+    return getattr(_override, "writer", None)
+
+
 def set_analytics_writer(writer: Optional[AnalyticsWriter]) -> Optional[AnalyticsWriter]:
     """Override the writer FOR THIS THREAD; returns the previous override.
 
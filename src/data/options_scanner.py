@@ -1,7 +1,9 @@
 """Options scanning utilities for wheel strategy opportunity identification."""
 
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import pandas as pd
 import structlog
 import numpy as np
@@ -43,13 +45,47 @@ from .decision_record import (
 
 logger = structlog.get_logger(__name__)
 
+# Concurrent per-symbol put chain fetches for the live entry points (/scan,
+# the CLI). Each fetch is a handful of Alpaca round trips and almost all wall
+# time is waiting on them; eight keeps a full watchlist well inside the rate
+# limit that ``api_retry`` backs off against.
+PUT_SCAN_WORKERS = 8
+
+
+def _carry_thread_context(fn: Callable) -> Callable:
+    """Wrap ``fn`` so a pool thread runs it under THIS thread's context.
+
+    The replay seams are thread-local on purpose (the clock freeze and the
+    analytics writer override), and structlog keeps ``run_id`` in contextvars;
+    a worker thread inherits none of them. Captured here at wrap time and
+    reinstated around every call, so work handed to a pool sees the caller's
+    simulated time, writer and log context.
+    """
+    from .analytics_writer import get_analytics_writer_override, set_analytics_writer
+
+    frozen_at = clock.now() if clock.is_frozen() else None
+    writer = get_analytics_writer_override()
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        previous_writer = set_analytics_writer(writer)
+        try:
+            with clock.frozen(frozen_at):
+                # A Context can only be entered by one thread at a time.
+                return context.copy().run(fn, *args, **kwargs)
+        finally:
+            set_analytics_writer(previous_writer)
+
+    return run
+
 
 class OptionsScanner:
     """Scanner for identifying options wheel trading opportunities."""
     
     def __init__(self, alpaca_client: AlpacaClient, market_data: MarketDataManager,
                  config: Config, allow_bigquery: bool = True,
-                 earnings_calendar: Optional[object] = None):
+                 earnings_calendar: Optional[object] = None,
+                 scan_workers: int = 1):
         """Initialize options scanner.
 
         Args:
@@ -91,11 +127,18 @@ class OptionsScanner:
                 clock-keyed data-access policy is action at a distance,
                 ``is_frozen`` is thread-local, and explicit injection is the
                 seam every other replay gate here uses (FC-065 P1/P2).
+            scan_workers: threads the put scan fans its per-symbol chain
+                fetches out over; the symbol gates (earnings, held position)
+                always run on the calling thread. 1 (the default, and what
+                the replay uses) scans in order on the calling thread; the
+                live entry points pass ``PUT_SCAN_WORKERS``. Results are
+                identical either way.
         """
         self.alpaca = alpaca_client
         self.market_data = market_data
         self.config = config
         self.allow_bigquery = allow_bigquery
+        self.scan_workers = scan_workers
         # FC-065: the covered-call floor is Alpaca's avg_entry_price for the
         # equity position, with BigQuery running inline as a divergence
         # cross-check that can veto the broker's number but never supply one.
@@ -136,39 +179,28 @@ class OptionsScanner:
             # Get suitable stocks first
             suitable_stocks = self.market_data.filter_suitable_stocks(self.config.stock_symbols)
             
-            for stock in suitable_stocks:
-                symbol = stock['symbol']
-
-                # FC-013 put leg: N=2 days-until, symbol-level. Checked BEFORE
-                # `_has_existing_position` — both are network-or-cache checks,
-                # and gating first makes the event count read as the earnings
-                # exposure of the post-`filter_suitable_stocks` candidate set:
-                # the symbols that could otherwise have produced puts this
-                # scan, held or not. Stage-1 rejects are upstream and never
-                # reach the gate.
-                #
-                # Why N=2 and not span (DD-3): ten months of fills put put-side
-                # realized-loss risk in *immediate pre-event entries* (the GOOGL
-                # 04-28 shape, days_until=1), while wide-window pre-earnings put
-                # income was the book's best bucket — 100% win rate, $301
-                # average. A wide put window would forfeit the best trades to
-                # block a risk that lives in the last two days. The legs
-                # diverging is the deliberate choice, not an oversight.
-                if self._put_leg_blocked_by_earnings(symbol):
-                    continue
-
-                # Skip if we already have positions in this stock
-                if self._has_existing_position(symbol):
-                    continue
+            # The symbol gates stay on this thread, in stage-1 order: the
+            # earnings calendar's module cache and L2 blob assume one caller at
+            # a time (see EarningsCalendarService._get_cached). Only the chain
+            # fetch, which is network wait behind per-symbol cache keys, fans
+            # out; results are gathered in stage-1 order, which keeps the
+            # stable sort below (and so the output) unchanged.
+            if self.scan_workers > 1 and len(suitable_stocks) > 1:
+                candidates = [stock for stock in suitable_stocks
+                              if self._put_gates_pass(stock['symbol'])]
+                workers = max(1, min(self.scan_workers, len(candidates)))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    chains = list(pool.map(
+                        _carry_thread_context(self.market_data.find_suitable_puts),
+                        [stock['symbol'] for stock in candidates]))
+                for stock, puts in zip(candidates, chains):
+                    opportunities.extend(self._put_opportunities_from(stock, puts))
+            else:
+                for stock in suitable_stocks:
+                    if self._put_gates_pass(stock['symbol']):
+                        puts = self.market_data.find_suitable_puts(stock['symbol'])
+                        opportunities.extend(self._put_opportunities_from(stock, puts))
 
-                # Get put opportunities for this stock
-                puts = self.market_data.find_suitable_puts(symbol)
-                
-                for put in puts[:3]:  # Top 3 puts per stock
-                    opportunity = self._create_put_opportunity(put, stock)
-                    if opportunity:
-                        opportunities.append(opportunity)
-            
             # Sort by overall attractiveness score
             opportunities.sort(key=lambda x: x.get('attractiveness_score', 0), reverse=True)
 
@@ -204,6 +236,39 @@ class OptionsScanner:
             )
             return []
     
+    def _put_gates_pass(self, symbol: str) -> bool:
+        """Whether a stage-1 survivor goes on to a put chain fetch."""
+        # FC-013 put leg: N=2 days-until, symbol-level. Checked BEFORE
+        # `_has_existing_position` — both are network-or-cache checks,
+        # and gating first makes the event count read as the earnings
+        # exposure of the post-`filter_suitable_stocks` candidate set:
+        # the symbols that could otherwise have produced puts this
+        # scan, held or not. Stage-1 rejects are upstream and never
+        # reach the gate.
+        #
+        # Why N=2 and not span (DD-3): ten months of fills put put-side
+        # realized-loss risk in *immediate pre-event entries* (the GOOGL
+        # 04-28 shape, days_until=1), while wide-window pre-earnings put
+        # income was the book's best bucket — 100% win rate, $301
+        # average. A wide put window would forfeit the best trades to
+        # block a risk that lives in the last two days. The legs
+        # diverging is the deliberate choice, not an oversight.
+        if self._put_leg_blocked_by_earnings(symbol):
+            return False
+
+        # Skip if we already have positions in this stock
+        return not self._has_existing_position(symbol)
+
+    def _put_opportunities_from(self, stock: Dict[str, Any],
+                                puts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Scored opportunities for the top 3 of one symbol's suitable puts."""
+        opportunities = []
+        for put in puts[:3]:  # Top 3 puts per stock
+            opportunity = self._create_put_opportunity(put, stock)
+            if opportunity:
+                opportunities.append(opportunity)
+        return opportunities
+
     def scan_for_call_opportunities(self, max_results: int = 10,
                                     run_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Scan for covered call opportunities on assigned stock positions.
@@ -241,6 +306,10 @@ class OptionsScanner:
             uncovered_days = self.uncovered_days_resolver.resolve(
                 held_symbols, covered_underlyings(positions)
             )
+            # Every coverable holding reads its stock metrics when its
+            # candidates are built; fetch them together up front.
+            self.market_data.prefetch_stock_metrics(
+                [p['symbol'] for p in stock_positions if int(float(p['qty'])) >= 100])
 
             for position in stock_positions:
                 symbol = position['symbol']
@@ -622,6 +691,9 @@ class OptionsScanner:
             Dictionary with 'puts' and 'calls' opportunity lists
         """
         try:
+            # Sequential on purpose: both legs go through the earnings
+            # calendar's single-caller cache, and the put leg's stage-1 quote
+            # and bar batch would race the call leg's metrics prefetch.
             put_opportunities = self.scan_for_put_opportunities(20)
             call_opportunities = self.scan_for_call_opportunities(10)
             
@@ -1086,7 +1158,9 @@ class OptionsScanner:
             suitable_count = 0
             iv_ranks = []
             
-            for symbol in self.config.stock_symbols[:10]:  # Sample first 10 for performance
+            sample = self.config.stock_symbols[:10]  # Sample first 10 for performance
+            self.market_data.prefetch_stock_metrics(sample)
+            for symbol in sample:
                 try:
                     stock_metrics = self.market_data.get_stock_metrics(symbol)
                     if stock_metrics.get('suitable_for_wheel', False):
@@ -2,6 +2,7 @@
 
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 import structlog
 import json
@@ -38,20 +39,15 @@ class PortfolioTracker:
             account_info = self.alpaca.get_account()
             positions = self.alpaca.get_positions()
             
-            # Separate positions by type
+            # Long stock positions (shared filter), then option totals, P&L and
+            # the per-underlying grouping in a single pass over all positions
             stock_positions = get_stock_positions(positions)
-            option_positions = [p for p in positions if p['asset_class'] == 'us_option']
-            
-            # Calculate position values
             total_stock_value = sum(float(p['market_value']) for p in stock_positions)
-            total_option_value = sum(float(p['market_value']) for p in option_positions)
+            summary = self._summarize_positions(positions)
+            underlying_positions = summary['underlying_positions']
+            total_option_value = summary['option_value']
             total_position_value = total_stock_value + total_option_value
-            
-            # Calculate P&L
-            total_unrealized_pl = sum(float(p['unrealized_pl']) for p in positions)
-            
-            # Group positions by underlying symbol
-            underlying_positions = self._group_positions_by_underlying(positions)
+            total_unrealized_pl = summary['unrealized_pl']
             
             # Calculate wheel-specific metrics
             wheel_metrics = self._calculate_wheel_metrics(underlying_positions)
@@ -67,7 +63,7 @@ class PortfolioTracker:
                 'positions': {
                     'total_count': len(positions),
                     'stock_positions': len(stock_positions),
-                    'option_positions': len(option_positions),
+                    'option_positions': summary['option_count'],
                     'total_value': total_position_value,
                     'stock_value': total_stock_value,
                     'option_value': total_option_value
@@ -93,29 +89,41 @@ class PortfolioTracker:
             logger.error("Failed to get portfolio snapshot", event_category="error", event_type="portfolio_snapshot_failed", error=str(e))
             return {'error': str(e)}
     
-    def _group_positions_by_underlying(self, positions: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Group positions by underlying symbol.
+    def _summarize_positions(self, positions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Group positions by underlying symbol and total them, in one pass.
         
         Args:
             positions: List of all positions
             
         Returns:
-            Dictionary grouped by underlying symbol
+            ``underlying_positions`` (dictionary grouped by underlying symbol)
+            plus ``option_count``/``option_value`` over option positions and
+            ``unrealized_pl`` over every position
         """
         underlying_positions = {}
+        option_count = 0
+        option_value = unrealized_pl = 0.0
         
         for position in positions:
             symbol = position['symbol']
+            asset_class = position['asset_class']
+            market_value = float(position['market_value'])
+            pl = float(position['unrealized_pl'])
+            unrealized_pl += pl
             
-            if position['asset_class'] == 'us_equity':
+            if asset_class == 'us_equity':
                 underlying = symbol
             else:
                 # Extract underlying from option symbol (simplified)
                 # In practice, this would need proper option symbol parsing
                 underlying = symbol.split()[0] if ' ' in symbol else symbol.split('_')[0]
+                if asset_class == 'us_option':
+                    option_count += 1
+                    option_value += market_value
             
-            if underlying not in underlying_positions:
-                underlying_positions[underlying] = {
+            group = underlying_positions.get(underlying)
+            if group is None:
+                group = underlying_positions[underlying] = {
                     'underlying_symbol': underlying,
                     'stock_position': None,
                     'option_positions': [],
@@ -124,19 +132,24 @@ class PortfolioTracker:
                     'wheel_stage': 'none'  # none, cash_secured_puts, assigned_stock, covered_calls
                 }
             
-            if position['asset_class'] == 'us_equity':
-                underlying_positions[underlying]['stock_position'] = position
+            if asset_class == 'us_equity':
+                group['stock_position'] = position
             else:
-                underlying_positions[underlying]['option_positions'].append(position)
+                group['option_positions'].append(position)
             
-            underlying_positions[underlying]['total_value'] += float(position['market_value'])
-            underlying_positions[underlying]['total_pl'] += float(position['unrealized_pl'])
+            group['total_value'] += market_value
+            group['total_pl'] += pl
         
         # Determine wheel stage for each underlying
-        for underlying, data in underlying_positions.items():
+        for data in underlying_positions.values():
             data['wheel_stage'] = self._determine_wheel_stage(data)
         
-        return underlying_positions
+        return {
+            'underlying_positions': underlying_positions,
+            'option_count': option_count,
+            'option_value': option_value,
+            'unrealized_pl': unrealized_pl,
+        }
     
     def _determine_wheel_stage(self, underlying_data: Dict[str, Any]) -> str:
         """Determine the current wheel strategy stage for an underlying.
@@ -228,6 +241,9 @@ class PortfolioTracker:
             if len(recent_snapshots) < 2:
                 return {'error': f'Insufficient data for {days_back} day analysis'}
             
+            # Portfolio value series for the window
+            values = np.array([s['account']['portfolio_value'] for s in recent_snapshots], dtype=float)
+            
             # Calculate metrics
             first_snapshot = recent_snapshots[0]
             last_snapshot = recent_snapshots[-1]
@@ -248,12 +264,12 @@ class PortfolioTracker:
             
             # Calculate volatility and Sharpe ratio (if we have enough data points)
             if len(recent_snapshots) >= 10:
-                values = [s['account']['portfolio_value'] for s in recent_snapshots]
                 # Calculate daily returns in decimal form
-                returns = [((values[i] - values[i-1]) / values[i-1]) for i in range(1, len(values)) if values[i-1] > 0]
+                prev, curr = values[:-1], values[1:]
+                valid = prev > 0
+                returns = (curr[valid] - prev[valid]) / prev[valid]
 
-                if returns:
-                    import numpy as np
+                if returns.size:
                     # Keep volatility in decimal form for Sharpe calculation
                     daily_volatility = np.std(returns)
                     annualized_volatility_decimal = daily_volatility * np.sqrt(365)
@@ -275,14 +291,11 @@ class PortfolioTracker:
                 volatility = 0
                 sharpe_ratio = 0
             
-            # Max drawdown calculation
-            max_value = initial_value
-            max_drawdown = 0
-            for snapshot in recent_snapshots:
-                current_value = snapshot['account']['portfolio_value']
-                max_value = max(max_value, current_value)
-                drawdown = (max_value - current_value) / max_value * 100 if max_value > 0 else 0
-                max_drawdown = max(max_drawdown, drawdown)
+            # Max drawdown calculation (running peak starts at the first value)
+            peaks = np.maximum.accumulate(values)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                drawdowns = np.where(peaks > 0, (peaks - values) / peaks * 100, 0.0)
+            max_drawdown = max(0.0, float(drawdowns.max()))
             
             return {
                 'period_days': actual_days,
@@ -358,6 +358,7 @@ class ExecutionEngine:
         put_seller: PutSeller,
         available_buying_power: float,
         positions: Optional[List[Dict[str, Any]]] = None,
+        account_info: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """Size every opportunity and return it ranked, by type.
 
@@ -381,6 +382,9 @@ class ExecutionEngine:
             available_buying_power: Current buying power for put sizing.
             positions: Optional positions snapshot; fetched when omitted and
                 at least one call opportunity is present.
+            account_info: Optional account snapshot for put sizing; fetched
+                once, at the first put, when omitted. Every put in the pass is
+                sized against the same read rather than one read apiece.
 
         Returns:
             List of metric dicts, calls first then puts.
@@ -427,8 +431,11 @@ class ExecutionEngine:
                 premium_collected = opp['premium'] * 100 * contracts
                 roi = 0.0  # meaningless against zero collateral — see _call_rank_score
             else:
+                if account_info is None:
+                    account_info = self.alpaca_client.get_account()
                 position_size = put_seller._calculate_position_size(
-                    opp, override_buying_power=available_buying_power
+                    opp, override_buying_power=available_buying_power,
+                    account_info=account_info
                 )
                 if not position_size:
                     self._log_drop(
@@ -33,19 +33,23 @@ class PutSeller:
         # `/run` was already gone by `/monitor` — the gate has been open since
         # inception. Hold discipline lives in the DTE profit bands.
 
-    def _calculate_position_size(self, put_option: Dict[str, Any], override_buying_power: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    def _calculate_position_size(self, put_option: Dict[str, Any], override_buying_power: Optional[float] = None,
+                                 account_info: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """Calculate appropriate position size for put selling.
 
         Args:
             put_option: Put option details
             override_buying_power: Optional buying power override (for tracking during execution loop)
+            account_info: Optional account snapshot, so a loop sizing many
+                opportunities reads the account once; fetched when omitted
 
         Returns:
             Position sizing details or None if invalid
         """
         try:
             # Get account info
-            account_info = self.alpaca.get_account()
+            if account_info is None:
+                account_info = self.alpaca.get_account()
             portfolio_value = float(account_info['portfolio_value'])
 
             # Use override if provided (for local tracking during execution),
@@ -12,7 +12,7 @@ from ..utils.logging_events import log_system_event, log_trade_event, log_error_
 from ..utils.positions import get_stock_positions
 from ..utils.option_symbols import parse_option_symbol
 from .call_roller import CallRoller
-from .wheel_state_manager import WheelStateManager
+from .wheel_state_manager import WheelStateManager, new_symbol_state
 from ..risk.risk_manager import RiskManager
 from ..api.earnings_calendar import EarningsCalendarService
 
@@ -510,14 +510,11 @@ class WheelEngine:
                     puts=actual_opts['puts'],
                     calls=actual_opts['calls'])
 
-                self.wheel_state.symbol_states[symbol] = {
-                    'stock_shares': actual_shares,
-                    'stock_cost_basis': 0.0,
-                    'acquisition_date': None,
-                    'active_puts': actual_opts['puts'],
-                    'active_calls': actual_opts['calls'],
-                    'wheel_cycle_start': None,
-                }
+                self.wheel_state.symbol_states[symbol] = new_symbol_state(
+                    stock_shares=actual_shares,
+                    active_puts=actual_opts['puts'],
+                    active_calls=actual_opts['calls'],
+                )
                 stats['state_updates'] += 1
 
             # 3. Clear state entries that have no Alpaca position at all
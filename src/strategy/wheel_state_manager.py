@@ -46,6 +46,24 @@ class WheelPhase(Enum):
     SELLING_CALLS = "selling_calls"         # Actively selling covered calls on stock position
 
 
+def new_symbol_state(stock_shares: int = 0, active_puts: int = 0,
+                     active_calls: int = 0) -> Dict[str, Any]:
+    """Build a ``symbol_states`` entry with every key present.
+
+    Both writers (put assignment here, the untracked-position sweep in
+    ``WheelEngine.reconcile_positions``) seed through this, so readers can
+    index the keys directly instead of probing with ``.get`` defaults.
+    """
+    return {
+        'stock_shares': stock_shares,
+        'stock_cost_basis': 0.0,
+        'acquisition_date': None,
+        'active_puts': active_puts,
+        'active_calls': active_calls,
+        'wheel_cycle_start': None,
+    }
+
+
 class WheelStateManager:
     """Per-request position bookkeeping for reconciliation.
 
@@ -75,8 +93,8 @@ class WheelStateManager:
         state = self.symbol_states[symbol]
 
         # Determine phase based on positions
-        has_stock = state.get('stock_shares', 0) > 0
-        has_active_calls = state.get('active_calls', 0) > 0
+        has_stock = state['stock_shares'] > 0
+        has_active_calls = state['active_calls'] > 0
 
         if has_stock and has_active_calls:
             return WheelPhase.SELLING_CALLS
@@ -100,20 +118,13 @@ class WheelStateManager:
             State update summary
         """
         if symbol not in self.symbol_states:
-            self.symbol_states[symbol] = {
-                'stock_shares': 0,
-                'stock_cost_basis': 0.0,
-                'acquisition_date': None,
-                'active_puts': 0,
-                'active_calls': 0,
-                'wheel_cycle_start': None,
-            }
+            self.symbol_states[symbol] = new_symbol_state()
 
         state = self.symbol_states[symbol]
 
         # Update stock position
         current_shares = state['stock_shares']
-        current_total_cost = current_shares * state.get('stock_cost_basis', 0)
+        current_total_cost = current_shares * state['stock_cost_basis']
         new_total_cost = current_total_cost + (shares * cost_basis)
         new_total_shares = current_shares + shares
 
@@ -213,7 +224,7 @@ class WheelStateManager:
 
         if remaining_shares == 0:
             wheel_cycle_completed = True
-            cycle_start = state.get('wheel_cycle_start')
+            cycle_start = state['wheel_cycle_start']
 
             if cycle_start:
                 cycle_data = {
@@ -323,9 +334,9 @@ class WheelStateManager:
             'symbol': symbol,
             'wheel_phase': phase.value,
             'stock_shares': state['stock_shares'],
-            'stock_cost_basis': state.get('stock_cost_basis', 0),
-            'acquisition_date': state.get('acquisition_date'),
+            'stock_cost_basis': state['stock_cost_basis'],
+            'acquisition_date': state['acquisition_date'],
             'active_puts': state['active_puts'],
             'active_calls': state['active_calls'],
-            'wheel_cycle_start': state.get('wheel_cycle_start'),
+            'wheel_cycle_start': state['wheel_cycle_start'],
         }
@@ -70,7 +70,7 @@ def is_frozen() -> bool:
 
 
 @contextmanager
-def frozen(dt: datetime):
+def frozen(dt: Optional[datetime]):
     """Temporarily freeze ``now()`` to ``dt``, restoring the prior state on exit."""
     prev = _get_frozen()
     _state.frozen_now = dt
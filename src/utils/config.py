@@ -1,5 +1,6 @@
 """Configuration management for Options Wheel strategy."""
 
+import copy
 import os
 import yaml
 from pathlib import Path
@@ -54,6 +55,12 @@ def _load_secret(secret_id: str, fallback_env_var: str) -> str:
     return ""
 
 
+# Parsed settings files, keyed by (resolved path, mtime, size) so an edited
+# file is re-read. Each Config gets a deep copy: env substitution and tests
+# mutate ``_config`` in place, so instances must never share the dict.
+_PARSED_YAML: Dict[tuple, Any] = {}
+
+
 class Config:
     """Configuration manager for the options wheel strategy."""
     
@@ -81,8 +88,12 @@ class Config:
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         try:
-            with open(self.config_path, 'r') as file:
-                return yaml.safe_load(file)
+            stat = os.stat(self.config_path)
+            key = (str(self.config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+            if key not in _PARSED_YAML:
+                with open(self.config_path, 'r') as file:
+                    _PARSED_YAML[key] = yaml.safe_load(file)
+            return copy.deepcopy(_PARSED_YAML[key])
         except FileNotFoundError:
             logger.error("Configuration file not found", event_category="error", event_type="config_file_not_found", path=self.config_path)
             raise
@@ -66,17 +66,10 @@ class OptionSymbolGenerator:
         Returns:
             List of expiration dates (Fridays) within the DTE range
         """
-        expirations = []
-        current_date = start_date
-        end_date = start_date + timedelta(days=max_dte)
-        
-        # Find all Fridays within the range
-        while current_date <= end_date:
-            if current_date.weekday() == 4:  # Friday = 4
-                expirations.append(current_date)
-            current_date += timedelta(days=1)
-        
-        return expirations
+        # Step to the first Friday (Friday = 4), then a week at a time
+        first_friday = start_date + timedelta(days=(4 - start_date.weekday()) % 7)
+        weeks = (max_dte - (first_friday - start_date).days) // 7 + 1
+        return [first_friday + timedelta(weeks=i) for i in range(max(weeks, 0))]
     
     def get_monthly_expiration(self, year: int, month: int) -> datetime:
         """Get the monthly expiration date (3rd Friday) for a given month.
@@ -198,6 +198,42 @@ class TestAlpacaClientInit:
         client = AlpacaClient(mock_config)
         assert client.config == mock_config
 
+    def test_every_sdk_client_shares_one_keep_alive_pool(self, mock_config):
+        """Real SDK clients (no network at construction) from two
+        AlpacaClients all send through the same pooled session."""
+        first = AlpacaClient(mock_config)
+        second = AlpacaClient(mock_config)
+
+        sessions = {id(c._session) for c in (
+            first.trading_client, first.stock_data_client, first.option_data_client,
+            second.trading_client, second.stock_data_client, second.option_data_client)}
+        assert len(sessions) == 1
+
+        adapter = first.trading_client._session.get_adapter('https://data.alpaca.markets')
+        assert adapter._pool_maxsize == 16
+
+    @patch('src.api.alpaca_client.TradingClient')
+    @patch('src.api.alpaca_client.StockHistoricalDataClient')
+    @patch('src.api.alpaca_client.OptionHistoricalDataClient')
+    def test_an_sdk_client_without_a_session_keeps_its_own_transport(
+        self,
+        mock_option_client,
+        mock_stock_client,
+        mock_trading_client,
+        mock_config
+    ):
+        """If an SDK upgrade drops the private ``_session``, construction still
+        works and nothing is bolted onto the client."""
+        class NoSession:
+            pass
+        sdk = NoSession()
+        mock_trading_client.return_value = sdk
+
+        client = AlpacaClient(mock_config)
+
+        assert client.trading_client is sdk
+        assert not hasattr(sdk, '_session')
+
 
 class TestAlpacaClientAccount:
     """Test AlpacaClient account methods."""
@@ -508,6 +544,63 @@ class TestAlpacaClientMarketData:
         assert quote['bid_size'] == 100
         assert quote['ask_size'] == 100
 
+    @patch('src.api.alpaca_client.TradingClient')
+    @patch('src.api.alpaca_client.StockHistoricalDataClient')
+    @patch('src.api.alpaca_client.OptionHistoricalDataClient')
+    def test_get_stock_quotes_is_one_request(
+        self,
+        mock_option_client,
+        mock_stock_client,
+        mock_trading_client,
+        mock_config
+    ):
+        """get_stock_quotes batches the symbols and omits ones with no quote."""
+        mock_quote = MagicMock()
+        mock_quote.bid_price = 174.50
+        mock_quote.ask_price = 175.50
+        mock_quote.bid_size = 100
+        mock_quote.ask_size = 200
+        mock_quote.timestamp = datetime.now(timezone.utc)
+
+        latest = mock_stock_client.return_value.get_stock_latest_quote
+        latest.return_value = {'AAPL': mock_quote}
+
+        client = AlpacaClient(mock_config)
+        quotes = client.get_stock_quotes(['AAPL', 'MSFT'])
+
+        assert latest.call_count == 1
+        assert latest.call_args[0][0].symbol_or_symbols == ['AAPL', 'MSFT']
+        assert list(quotes) == ['AAPL']
+        assert quotes['AAPL'] == client.get_stock_quote('AAPL')
+
+    @patch('src.api.alpaca_client.TradingClient')
+    @patch('src.api.alpaca_client.StockHistoricalDataClient')
+    @patch('src.api.alpaca_client.OptionHistoricalDataClient')
+    def test_get_stock_bars_bulk_is_one_request(
+        self,
+        mock_option_client,
+        mock_stock_client,
+        mock_trading_client,
+        mock_config
+    ):
+        """get_stock_bars_bulk batches the symbols and omits ones with no bars."""
+        mock_bar = MagicMock()
+        mock_bar.timestamp = datetime(2026, 8, 3, 4, 0, tzinfo=timezone.utc)
+        mock_bar.open, mock_bar.high, mock_bar.low, mock_bar.close = 10.0, 11.0, 9.5, 10.5
+        mock_bar.volume = 1000
+
+        get_bars = mock_stock_client.return_value.get_stock_bars
+        get_bars.return_value = MagicMock(data={'AAPL': [mock_bar], 'MSFT': []})
+
+        client = AlpacaClient(mock_config)
+        frames = client.get_stock_bars_bulk(['AAPL', 'MSFT', 'NVDA'])
+
+        assert get_bars.call_count == 1
+        assert get_bars.call_args[0][0].symbol_or_symbols == ['AAPL', 'MSFT', 'NVDA']
+        assert list(frames) == ['AAPL']
+        assert frames['AAPL']['close'].tolist() == [10.5]
+        assert frames['AAPL']['volume'].tolist() == [1000]
+
 
 class TestAlpacaClientOrders:
     """Test AlpacaClient order methods."""
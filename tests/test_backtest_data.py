@@ -7,11 +7,14 @@ an in-memory mock provider.
 
 from __future__ import annotations
 
+import dataclasses
 import math
 from datetime import date, datetime, time, timedelta
 from typing import Dict, List
 
+import numpy as np
 import pytest
+from scipy.special import ndtr
 
 from src.backtesting.data import greeks
 from src.backtesting.data.chain_builder import (
@@ -64,6 +67,86 @@ class TestGreeks:
         assert greeks.bs_delta(95, 100, 0, 0.04, 0.3, 0, "call") == 0.0
 
 
+class TestGreeksArrayForms:
+    """The ``*_vec`` forms ChainBuilder uses must agree with the scalar
+    reference implementations contract for contract, edge cases included."""
+
+    @staticmethod
+    def _grid():
+        rows = []
+        for S in (50.0, 100.0, 412.5):
+            for k_frac in (0.7, 0.9, 0.97, 1.0, 1.03, 1.1, 1.4):
+                for dte in (0, 1, 7, 30, 120):
+                    for opt in ("put", "call"):
+                        rows.append((S, round(S * k_frac, 2), greeks.year_fraction(dte), opt))
+        return rows
+
+    def test_array_normal_cdf_matches_the_scalar_one(self):
+        # The array forms use scipy's ndtr, the scalar forms math.erf. Every
+        # parity check below rests on the two CDFs agreeing, tails included.
+        xs = np.concatenate([np.linspace(-12.0, 12.0, 4801), [-37.5, -1e-9, 0.0, 1e-9, 37.5]])
+        got = ndtr(xs)
+        for x, y in zip(xs.tolist(), got.tolist()):
+            assert y == pytest.approx(greeks._norm_cdf(x), abs=1e-10)
+
+    def test_price_and_delta_match_scalar(self):
+        rows = self._grid()
+        S, K, T = (np.array(col) for col in list(zip(*rows))[:3])
+        is_call = np.array([r[3] == "call" for r in rows])
+        for sigma in (0.05, 0.3, 1.2):
+            prices = greeks.bs_price_vec(S, K, T, 0.04, sigma, 0.01, is_call)
+            deltas = greeks.bs_delta_vec(S, K, T, 0.04, sigma, 0.01, is_call)
+            for (s_, k_, t_, opt), p, d in zip(rows, prices, deltas):
+                assert p == pytest.approx(greeks.bs_price(s_, k_, t_, 0.04, sigma, 0.01, opt), abs=1e-10)
+                assert d == pytest.approx(greeks.bs_delta(s_, k_, t_, 0.04, sigma, 0.01, opt), abs=1e-12)
+
+    def test_terminal_and_degenerate_inputs_match_scalar(self):
+        cases = [
+            (105, 100, 0.0, 0.3, "call"), (95, 100, 0.0, 0.3, "call"),
+            (95, 100, 0.0, 0.3, "put"), (100, 100, 0.0, 0.3, "put"),
+            (105, 100, 0.1, 0.0, "call"), (105, 100, 0.1, -0.2, "put"),
+        ]
+        S, K, T, sig = (np.array(col, dtype=float) for col in list(zip(*cases))[:4])
+        is_call = np.array([c[4] == "call" for c in cases])
+        prices = greeks.bs_price_vec(S, K, T, 0.04, sig, 0.0, is_call)
+        deltas = greeks.bs_delta_vec(S, K, T, 0.04, sig, 0.0, is_call)
+        for (s_, k_, t_, v_, opt), p, d in zip(cases, prices, deltas):
+            assert p == greeks.bs_price(s_, k_, t_, 0.04, v_, 0.0, opt)
+            assert d == greeks.bs_delta(s_, k_, t_, 0.04, v_, 0.0, opt)
+
+    def test_nan_vol_gives_nan_delta(self):
+        d = greeks.bs_delta_vec(100.0, np.array([95.0, 95.0]), 0.02, 0.04,
+                                np.array([0.3, np.nan]), 0.0, np.array([False, False]))
+        assert not math.isnan(d[0]) and math.isnan(d[1])
+
+    def test_implied_vol_matches_scalar(self):
+        rows = [r for r in self._grid() if r[2] > 0.005]
+        marks = []
+        for i, (s_, k_, t_, opt) in enumerate(rows):
+            sigma = (0.12, 0.35, 0.8, 2.5)[i % 4]
+            price = greeks.bs_price(s_, k_, t_, 0.04, sigma, 0.01, opt)
+            # every third mark is perturbed: some land below the low-vol
+            # floor / above the bracket and must come back unsolved
+            marks.append(round(price * (0.5 if i % 3 == 0 else 1.0), 2))
+        marks += [0.0, 0.001, 1e6]
+        rows += [(100.0, 95.0, 0.02, "put"), (100.0, 130.0, 0.02, "put"), (100.0, 100.0, 0.1, "call")]
+
+        S, K, T = (np.array(col) for col in list(zip(*rows))[:3])
+        is_call = np.array([r[3] == "call" for r in rows])
+        vec = greeks.implied_vol_vec(np.array(marks), S, K, T, 0.04, 0.01, is_call)
+
+        solved = unsolved = 0
+        for (s_, k_, t_, opt), mark, v in zip(rows, marks, vec):
+            ref = greeks.implied_vol(mark, s_, k_, t_, 0.04, 0.01, opt)
+            if ref is None:
+                unsolved += 1
+                assert math.isnan(v)
+            else:
+                solved += 1
+                assert v == pytest.approx(ref, abs=1e-9)
+        assert solved > 50 and unsolved > 10  # the grid exercises both paths
+
+
 # --------------------------------------------------------------------------- #
 # Spread model
 # --------------------------------------------------------------------------- #
@@ -87,6 +170,15 @@ class TestSpreadModel:
         assert bid == 0.0
         assert ask > 0.10
 
+    def test_array_form_matches_scalar_exactly(self):
+        marks = [0.0, 0.01, 0.10, 0.4999, 0.50, 0.75, 2.0, 14.3]
+        for m in (SpreadModel(), SpreadModel(base_frac=0.5, abs_floor=0.5)):
+            for moneyness in (0.0, 0.03, 0.15, 0.6):
+                bids, asks = m.bid_ask_vec(marks, np.full(len(marks), moneyness))
+                assert list(zip(bids.tolist(), asks.tolist())) == [
+                    m.bid_ask(mark, moneyness) for mark in marks
+                ]
+
     def test_calibrate_excludes_cheap_and_floor_pinned_samples(self):
         """Both classes bias the fit; including them tightened base_frac ~4x
         on a real 450-contract sample."""
@@ -349,6 +441,21 @@ class TestChainBuilder:
         b = ChainBuilder(p)
         assert b.build("XYZ", date(2025, 1, 7), max_dte=7) is None  # no stock bar
 
+    def test_quote_lookup_by_symbol(self):
+        p, as_of, exp = self._provider_with_chain()
+        snap = ChainBuilder(p).build("XYZ", as_of, max_dte=7)
+        for q in snap.all_quotes():
+            assert snap.quote(q.symbol) is q
+        assert snap.quote(_occ("XYZ", exp, "call", 100)) is None
+        # A replaced snapshot indexes its own quotes; the index never leaks
+        # into equality or repr.
+        extra = dataclasses.replace(snap.puts[0], symbol="EXTRA")
+        grown = dataclasses.replace(snap, calls=[*snap.calls, extra])
+        assert grown.quote("EXTRA") is extra
+        assert snap.quote("EXTRA") is None
+        assert grown == dataclasses.replace(snap, calls=[*snap.calls, extra])
+        assert "_by_symbol" not in repr(snap)
+
 
 # --------------------------------------------------------------------------- #
 # Chain store round-trip
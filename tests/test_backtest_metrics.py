@@ -496,6 +496,18 @@ class TestFitness:
         assert r.return_on_collateral == pytest.approx(0.10)   # 10% on capital at risk
         assert r.avg_collateral == pytest.approx(9000.0)
 
+    def test_collateral_average_skips_idle_days_and_peak_does_not(self):
+        days = [D(2025, 1, 6), D(2025, 1, 7), D(2025, 1, 8), D(2025, 1, 9)]
+        states = [
+            DailyState(day=d, equity=100_000.0, cash=100_000.0 - c,
+                       reserved_collateral=c, open_options=int(c > 0), shares_held={})
+            for d, c in zip(days, (0.0, 6000.0, 12000.0, 0.0))
+        ]
+        r = compute_fitness("XYZ", states, [], 100_000.0)
+        assert r.avg_collateral == pytest.approx(9000.0)
+        assert r.peak_collateral == 12000.0
+        assert r.days_in_position == 2
+
     def test_win_rate_needs_closed_cycles(self):
         days = [D(2025, 1, 6), D(2025, 1, 8)]
         r = compute_fitness("XYZ", _states(days, [100_000, 100_000]), [], 100_000.0)
@@ -8,12 +8,16 @@ recommendation reading as an action already taken.
 
 from __future__ import annotations
 
+import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from unittest.mock import patch
 
 import pytest
 
 from src.backtesting.engine.rejections import HOLDS_UNDERLYING_REASON
+from src.backtesting.evaluate import CHAIN_WORKERS
 from src.backtesting.reporting.bq_writer import build_row, config_hash
 from src.backtesting.screen import (
     ScreenResult,
@@ -21,6 +25,7 @@ from src.backtesting.screen import (
     render_screen_summary,
     run_screen,
 )
+from src.utils.config import Config
 
 
 class _FakeReport:
@@ -550,3 +555,50 @@ class TestAnalyticsIsolationIsThreadLocal:
         assert "NoOpAnalyticsWriter" not in seen, (
             "a replay redirected a concurrent thread's analytics"
         )
+
+
+class TestParallelScreen:
+    def test_workers_keep_universe_order_and_failure_rows(self):
+        def _side_effect(symbol, *a, **kw):
+            if symbol == "BAD":
+                raise RuntimeError("kaboom")
+            return _FakeReport(symbol), None
+
+        # Threads stand in for processes so the patched evaluator is visible.
+        with patch("src.backtesting.screen.ProcessPoolExecutor", ThreadPoolExecutor), \
+                patch("src.backtesting.screen.evaluate_symbol", side_effect=_side_effect):
+            result = run_screen(symbols=["AAA", "BAD", "CCC", "DDD"], persist=False,
+                                run_sensitivity=False, workers=3,
+                                start=date(2025, 1, 1), end=date(2025, 6, 30))
+        assert [r.symbol for r in result.results] == ["AAA", "BAD", "CCC", "DDD"]
+        assert result.failures == ["BAD"]
+        assert result.tally()["fit"] == 3
+
+    @pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                        reason="the patched evaluator reaches workers only by fork")
+    def test_real_processes_round_trip_config_and_results(self):
+        """Real worker processes: the Config goes out and each SymbolResult
+        comes back by pickle, and the chain-build budget is split across the
+        pool rather than multiplied by it."""
+        with patch("src.backtesting.screen.evaluate_symbol", _evaluate_in_worker):
+            result = run_screen(config=Config(), symbols=["AAA", "BAD", "CCC", "DDD"],
+                                persist=False, run_sensitivity=False, workers=4,
+                                start=date(2025, 1, 1), end=date(2025, 6, 30))
+
+        assert [r.symbol for r in result.results] == ["AAA", "BAD", "CCC", "DDD"]
+        assert result.failures == ["BAD"]
+        ok = [r for r in result.results if r.ok]
+        assert {r.report.worker_pid for r in ok}.isdisjoint({os.getpid()})
+        assert {r.report.chain_workers for r in ok} == {CHAIN_WORKERS // 4}
+        assert {r.report.stock_symbols for r in ok} == {tuple(Config().stock_symbols)}
+
+
+def _evaluate_in_worker(symbol, start, end, *, config, chain_workers, **kw):
+    """Module-level so a forked worker runs it; echoes what the worker saw."""
+    if symbol == "BAD":
+        raise RuntimeError("kaboom")
+    report = _FakeReport(symbol)
+    report.worker_pid = os.getpid()
+    report.chain_workers = chain_workers
+    report.stock_symbols = tuple(config.stock_symbols)
+    return report, None
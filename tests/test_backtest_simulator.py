@@ -254,6 +254,15 @@ class TestDayLoop:
         assert underlying_return == pytest.approx(-0.30)
         assert result.total_return > underlying_return
 
+    def test_concurrent_chain_builds_replay_identically(self, falling_then_flat):
+        """chain_workers only changes how chains are fetched, never which."""
+        days, closes, exps = falling_then_flat
+        serial = _simulator("XYZ", closes, exps, days).run()
+        fanned = _simulator("XYZ", closes, exps, days, chain_workers=4).run()
+        assert [(e.kind, e.event_date, e.symbol) for e in fanned.broker.ledger] == \
+            [(e.kind, e.event_date, e.symbol) for e in serial.broker.ledger]
+        assert [s.equity for s in fanned.daily] == [s.equity for s in serial.daily]
+
     def test_cash_ledger_is_conserved_no_phantom_margin(self, falling_then_flat):
         days, closes, exps = falling_then_flat
         result = _simulator("XYZ", closes, exps, days).run()
@@ -133,6 +133,31 @@ class TestConfig:
         finally:
             os.unlink(config_path)
 
+    def test_yaml_is_parsed_once_per_file_version(self):
+        """A second Config reuses the parse; instances never share the dict."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump(self.test_config_data, f)
+            config_path = f.name
+
+        try:
+            with patch.dict(os.environ, {'TEST_API_KEY': 'test_key', 'TEST_SECRET_KEY': 'test_secret'}), \
+                    patch('src.utils.config.yaml.safe_load', wraps=yaml.safe_load) as parse:
+                first = Config(config_path)
+                second = Config(config_path)
+                assert parse.call_count == 1
+
+                first._config['strategy']['put_target_dte'] = 99
+                assert second.put_target_dte == 7
+
+                data = dict(self.test_config_data, strategy=dict(
+                    self.test_config_data['strategy'], put_target_dte=14))
+                with open(config_path, 'w') as fh:
+                    yaml.dump(data, fh)
+                assert Config(config_path).put_target_dte == 14
+                assert parse.call_count == 2
+        finally:
+            os.unlink(config_path)
+
 
 # =========================================================================== #
 # FC-078 — the rolling knob set (T-13)
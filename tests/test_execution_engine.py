@@ -158,6 +158,29 @@ class TestRankOpportunities:
         # Verify mid_price was set on the opportunity
         assert opportunities[0]['mid_price'] == 1.50
 
+    def test_one_account_read_sizes_every_put_in_the_pass(self):
+        """The account is read once per ranking pass (or not at all when the
+        caller hands its snapshot in), never once per opportunity."""
+        opportunities = [
+            {'symbol': s, 'strike_price': 100.0, 'premium': 1.50,
+             'option_symbol': f'{s}250117P00100000'} for s in ('AAPL', 'MSFT', 'AMD')
+        ]
+        self.mock_put_seller._calculate_position_size.return_value = {'contracts': 1}
+        self.mock_alpaca.get_account.return_value = {'portfolio_value': 100000.0}
+
+        self.engine.rank_opportunities(opportunities, self.mock_put_seller, 50000.0)
+        assert self.mock_alpaca.get_account.call_count == 1
+        sized_with = {id(c.kwargs['account_info'])
+                      for c in self.mock_put_seller._calculate_position_size.call_args_list}
+        assert len(sized_with) == 1
+
+        snapshot = {'portfolio_value': 90000.0}
+        self.mock_alpaca.get_account.reset_mock()
+        self.engine.rank_opportunities(opportunities, self.mock_put_seller, 50000.0,
+                                       account_info=snapshot)
+        self.mock_alpaca.get_account.assert_not_called()
+        assert self.mock_put_seller._calculate_position_size.call_args.kwargs['account_info'] is snapshot
+
 
 class TestSelectBatch:
     """Test ExecutionEngine.select_batch."""
@@ -0,0 +1,84 @@
+"""Tests for the BigQuery view fixer script.
+
+`fix_json_field_references` rewrites production view SQL in place. It was
+collapsed from two sequential `re.sub` passes into one alternation regex; these
+tests pin its output to the two-pass behaviour it replaced, so a regex edit
+that changes what gets wrapped fails here rather than in BigQuery.
+"""
+
+import importlib.util
+import re
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "fix_bq_views.py"
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location("fix_bq_views", _SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture(scope="module")
+def fix():
+    return _load_script().fix_json_field_references
+
+
+def _two_pass(sql_content):
+    """The original implementation, verbatim: casts first, then bare refs."""
+    sql_content = re.sub(
+        r'CAST\(jsonPayload\.(\w+) AS (FLOAT64|INT64|BOOL)\)',
+        r'CAST(JSON_VALUE(jsonPayload.\1) AS \2)',
+        sql_content
+    )
+    sql_content = re.sub(
+        r'(?<!JSON_VALUE\()jsonPayload\.(\w+)(?!\s+AS\s+(?:FLOAT64|INT64|BOOL))',
+        r'JSON_VALUE(jsonPayload.\1)',
+        sql_content
+    )
+    return sql_content
+
+
+CASES = {
+    "typed_cast": (
+        "SELECT CAST(jsonPayload.premium AS FLOAT64) AS premium FROM logs",
+        "SELECT CAST(JSON_VALUE(jsonPayload.premium) AS FLOAT64) AS premium FROM logs",
+    ),
+    "bare_reference": (
+        "SELECT jsonPayload.symbol AS symbol FROM logs",
+        "SELECT JSON_VALUE(jsonPayload.symbol) AS symbol FROM logs",
+    ),
+    "already_wrapped": (
+        "SELECT JSON_VALUE(jsonPayload.symbol) AS symbol FROM logs",
+        "SELECT JSON_VALUE(jsonPayload.symbol) AS symbol FROM logs",
+    ),
+    "no_json_fields": (
+        "SELECT timestamp, severity FROM logs WHERE severity = 'ERROR'",
+        "SELECT timestamp, severity FROM logs WHERE severity = 'ERROR'",
+    ),
+    "mixed_statement": (
+        "SELECT jsonPayload.symbol, CAST(jsonPayload.qty AS INT64),\n"
+        "  CAST(jsonPayload.filled AS BOOL), JSON_VALUE(jsonPayload.side)\n"
+        "FROM logs WHERE jsonPayload.event_type = 'trade'",
+        "SELECT JSON_VALUE(jsonPayload.symbol), CAST(JSON_VALUE(jsonPayload.qty) AS INT64),\n"
+        "  CAST(JSON_VALUE(jsonPayload.filled) AS BOOL), JSON_VALUE(jsonPayload.side)\n"
+        "FROM logs WHERE JSON_VALUE(jsonPayload.event_type) = 'trade'",
+    ),
+}
+
+
+@pytest.mark.parametrize("sql,expected", CASES.values(), ids=list(CASES))
+def test_output_matches_the_two_pass_rewrite(fix, sql, expected):
+    assert fix(sql) == expected
+    assert fix(sql) == _two_pass(sql)
+
+
+def test_the_shipped_views_rewrite_exactly_as_before(fix):
+    views = _SCRIPT.parents[1] / "docs" / "bigquery" / "views.sql"
+    if not views.exists():
+        pytest.skip("docs/bigquery/views.sql not present")
+    sql = views.read_text()
+    assert fix(sql) == _two_pass(sql)
@@ -13,12 +13,14 @@ a test that fails if it is lost:
 3. `>=` is inclusive: expiry-day-equals-event-day still carries the gap.
 """
 
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from unittest.mock import Mock
 
+import pandas as pd
 import pytest
 
 from src.api.market_data import MarketDataManager
+from src.utils import clock
 from src.utils.config import Config
 
 
@@ -455,3 +457,174 @@ class TestTheRollProfile(_RollProfileFixture):
         with pytest.raises(ValueError, match='criteria_profile'):
             self.market_data.find_suitable_calls(
                 'NVDA', min_strike_price=100.0, criteria_profile='rol')
+
+
+class TestPerSymbolCachesSpanAScan:
+    """`--command scan` runs ``get_market_overview`` and then
+    ``scan_all_opportunities`` over the same symbols. Both go through these two
+    TTL caches, so the scan re-uses the overview's quotes, bars and chains
+    instead of re-fetching them — and the TTL, not the caller, decides when a
+    value is stale.
+    """
+
+    T0 = datetime(2026, 8, 3, 10, 0)
+
+    def setup_method(self):
+        self.config = Mock(spec=Config)
+        self.config.min_stock_price = 10
+        self.config.max_stock_price = 1000
+        self.config.min_avg_volume = 1
+        self.alpaca = Mock()
+        self.alpaca.get_stock_quote.return_value = {'bid': 99.0, 'ask': 101.0}
+        self.alpaca.get_stock_bars.return_value = pd.DataFrame(
+            {'close': [98.0, 99.0, 100.0], 'volume': [1000, 1100, 1200]})
+        self.alpaca.get_options_chain.return_value = [{
+            'symbol': 'NVDA260807P00095000', 'option_type': 'put',
+            'strike_price': 95.0, 'expiration_date': '2026-08-07',
+            'bid': 1.0, 'ask': 1.2, 'last_price': 1.1,
+        }]
+        self.market_data = MarketDataManager(self.alpaca, self.config)
+
+    def test_repeat_reads_within_the_ttl_hit_the_api_once(self):
+        with clock.frozen(self.T0):
+            first = self.market_data.get_option_chain_with_analysis('NVDA')
+            self.market_data.get_stock_metrics('NVDA')
+        with clock.frozen(self.T0 + timedelta(minutes=4)):
+            again = self.market_data.get_option_chain_with_analysis('NVDA')
+            self.market_data.get_stock_metrics('NVDA')
+
+        assert again is first
+        assert self.alpaca.get_options_chain.call_count == 1
+        assert self.alpaca.get_stock_quote.call_count == 1
+        assert self.alpaca.get_stock_bars.call_count == 1
+
+    def test_entries_expire_after_the_ttl(self):
+        with clock.frozen(self.T0):
+            self.market_data.get_option_chain_with_analysis('NVDA')
+        with clock.frozen(self.T0 + timedelta(minutes=5)):
+            self.market_data.get_option_chain_with_analysis('NVDA')
+
+        assert self.alpaca.get_options_chain.call_count == 2
+        assert self.alpaca.get_stock_quote.call_count == 2
+
+
+class TestStageOneBatchesQuotes:
+    """`filter_suitable_stocks` fetches the quotes and bars it needs in one
+    request each and falls back to per-symbol calls if a request fails."""
+
+    SYMBOLS = ['AAPL', 'MSFT', 'NVDA']
+
+    def setup_method(self):
+        self.config = Mock(spec=Config)
+        self.config.min_stock_price = 10
+        self.config.max_stock_price = 1000
+        self.config.min_avg_volume = 1
+        self.alpaca = Mock()
+        self.alpaca.get_stock_quote.return_value = {'bid': 99.0, 'ask': 101.0}
+        self.alpaca.get_stock_quotes.side_effect = lambda symbols: {
+            s: {'bid': 49.0, 'ask': 51.0} for s in symbols}
+        self.alpaca.get_stock_bars.return_value = pd.DataFrame(
+            {'close': [98.0, 99.0, 100.0], 'volume': [1000, 1100, 1200]})
+        self.alpaca.get_stock_bars_bulk.side_effect = lambda symbols, days: {
+            s: pd.DataFrame({'close': [48.0, 49.0, 50.0], 'volume': [500, 600, 700]})
+            for s in symbols}
+        self.market_data = MarketDataManager(self.alpaca, self.config)
+
+    def test_one_quote_request_covers_every_symbol(self):
+        suitable = self.market_data.filter_suitable_stocks(self.SYMBOLS)
+
+        self.alpaca.get_stock_quotes.assert_called_once_with(self.SYMBOLS)
+        self.alpaca.get_stock_quote.assert_not_called()
+        assert [s['current_price'] for s in suitable] == [50.0] * 3
+
+    def test_cached_symbols_are_left_out_of_the_batch(self):
+        with clock.frozen(datetime(2026, 8, 3, 10, 0)):
+            self.market_data.get_stock_metrics('AAPL')
+            self.market_data.filter_suitable_stocks(self.SYMBOLS)
+
+        self.alpaca.get_stock_quotes.assert_called_once_with(['MSFT', 'NVDA'])
+
+    def test_a_failed_batch_falls_back_to_per_symbol_quotes(self):
+        self.alpaca.get_stock_quotes.side_effect = RuntimeError("429")
+
+        suitable = self.market_data.filter_suitable_stocks(self.SYMBOLS)
+
+        assert self.alpaca.get_stock_quote.call_count == 3
+        assert [s['current_price'] for s in suitable] == [100.0] * 3
+
+    def test_a_symbol_missing_from_the_batch_is_fetched_alone(self):
+        self.alpaca.get_stock_quotes.side_effect = lambda symbols: {
+            'AAPL': {'bid': 49.0, 'ask': 51.0}}
+
+        self.market_data.filter_suitable_stocks(['AAPL', 'MSFT'])
+
+        self.alpaca.get_stock_quote.assert_called_once_with('MSFT')
+
+    def test_one_bars_request_covers_every_symbol(self):
+        suitable = self.market_data.filter_suitable_stocks(self.SYMBOLS)
+
+        self.alpaca.get_stock_bars_bulk.assert_called_once_with(self.SYMBOLS, days=30)
+        self.alpaca.get_stock_bars.assert_not_called()
+        assert [s['avg_volume'] for s in suitable] == [600.0] * 3
+
+    def test_a_failed_bars_batch_falls_back_to_per_symbol_bars(self):
+        self.alpaca.get_stock_bars_bulk.side_effect = RuntimeError("429")
+
+        suitable = self.market_data.filter_suitable_stocks(self.SYMBOLS)
+
+        assert self.alpaca.get_stock_bars.call_count == 3
+        assert [s['avg_volume'] for s in suitable] == [1100.0] * 3
+
+    def test_a_symbol_missing_from_the_bars_batch_is_fetched_alone(self):
+        self.alpaca.get_stock_bars_bulk.side_effect = lambda symbols, days: {
+            'AAPL': pd.DataFrame({'close': [50.0, 51.0], 'volume': [500, 700]})}
+
+        self.market_data.filter_suitable_stocks(['AAPL', 'MSFT'])
+
+        self.alpaca.get_stock_bars.assert_called_once_with('MSFT', days=30)
+
+    def test_prefetch_leaves_later_reads_as_cache_hits(self):
+        with clock.frozen(datetime(2026, 8, 3, 10, 0)):
+            self.market_data.prefetch_stock_metrics(self.SYMBOLS)
+            prices = [self.market_data.get_stock_metrics(s)['current_price']
+                      for s in self.SYMBOLS]
+
+        assert prices == [50.0] * 3
+        self.alpaca.get_stock_quotes.assert_called_once_with(self.SYMBOLS)
+        self.alpaca.get_stock_bars_bulk.assert_called_once_with(self.SYMBOLS, days=30)
+        self.alpaca.get_stock_quote.assert_not_called()
+        self.alpaca.get_stock_bars.assert_not_called()
+
+
+class TestChainPreparation:
+    """`get_option_chain_with_analysis` parses each distinct expiry once; every
+    contract still gets its own DTE."""
+
+    def test_dte_per_contract_across_expiry_shapes(self):
+        config = Mock(spec=Config)
+        config.min_stock_price = 10
+        config.max_stock_price = 1000
+        config.min_avg_volume = 1
+        alpaca = Mock()
+        alpaca.get_stock_quote.return_value = {'bid': 99.0, 'ask': 101.0}
+        alpaca.get_stock_bars.return_value = pd.DataFrame(
+            {'close': [98.0, 99.0, 100.0], 'volume': [1000, 1100, 1200]})
+
+        def contract(strike, expiry, kind='put'):
+            return {'symbol': f'NVDA{strike}', 'option_type': kind, 'strike_price': strike,
+                    'expiration_date': expiry, 'bid': 1.0, 'ask': 1.2, 'last_price': 1.1}
+
+        alpaca.get_options_chain.return_value = [
+            contract(95.0, '2026-08-07'),
+            contract(90.0, '2026-08-07'),
+            contract(95.0, '2026-08-14T00:00:00'),
+            contract(105.0, datetime(2026, 8, 21), kind='call'),
+            contract(110.0, None, kind='call'),
+        ]
+        market_data = MarketDataManager(alpaca, config)
+
+        with clock.frozen(datetime(2026, 8, 3, 10, 0)):
+            chain = market_data.get_option_chain_with_analysis('NVDA')
+
+        assert [p['dte'] for p in chain['puts']] == [3, 3, 10]
+        assert [c['dte'] for c in chain['calls']] == [17]
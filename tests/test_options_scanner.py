@@ -1,10 +1,14 @@
 """Tests for options scanner module."""
 
+import threading
+
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
 
+from src.data.analytics_writer import get_analytics_writer_override, set_analytics_writer
 from src.data.options_scanner import OptionsScanner
+from src.utils import clock
 from src.utils.config import Config
 
 # Sentinel for "the key is not present at all", which is a distinct failure
@@ -862,6 +866,113 @@ class TestCallScanFailsClosedOnAnUnusableQuote:
         assert results[0]['current_stock_price'] == 310.0
 
 
+class TestParallelPutScan:
+    """`scan_workers > 1` fans the per-symbol put work out over threads; the
+    result must be exactly the sequential scan's."""
+
+    SYMBOLS = ['AAPL', 'MSFT', 'GOOGL', 'AMD', 'NVDA']
+
+    def _scanner(self, workers):
+        market_data = Mock()
+        market_data.filter_suitable_stocks.return_value = [
+            {'symbol': s, 'current_price': 100.0} for s in self.SYMBOLS]
+        # Equal scores across symbols, so the order is the stable sort's.
+        market_data.find_suitable_puts.side_effect = lambda symbol: [{
+            'symbol': f'{symbol}250117P{strike:05d}000',
+            'strike_price': float(strike),
+            'expiration_date': '2025-01-17',
+            'dte': 7,
+            'delta': -0.15,
+            'mid_price': 1.00,
+            'bid': 0.95,
+            'ask': 1.05,
+            'volume': 1000,
+            'open_interest': 5000,
+            'implied_volatility': 0.25,
+            'checked_at': clock.now(),
+        } for strike in (95, 90)]
+        alpaca = Mock()
+        alpaca.get_positions.return_value = [{'symbol': 'AMD', 'asset_class': 'us_equity'}]
+        config = Mock(spec=Config)
+        config.stock_symbols = self.SYMBOLS
+        return OptionsScanner(alpaca, market_data, config, scan_workers=workers), market_data
+
+    def test_threaded_scan_matches_the_sequential_one(self):
+        sequential, _ = self._scanner(1)
+        threaded, market_data = self._scanner(4)
+
+        with clock.frozen(datetime(2025, 1, 10, 15, 45)):
+            expected = sequential.scan_for_put_opportunities(max_results=20)
+            got = threaded.scan_for_put_opportunities(max_results=20)
+
+        assert got == expected
+        assert [o['symbol'] for o in got][:2] == ['AAPL', 'AAPL']
+        assert 'AMD' not in {o['symbol'] for o in got}
+        assert market_data.find_suitable_puts.call_count == 4
+
+    def test_chain_fetch_threads_see_the_callers_clock_and_writer(self):
+        """The replay seams are thread-local; pool threads must inherit them."""
+        scanner, market_data = self._scanner(4)
+        seen = []
+        market_data.find_suitable_puts.side_effect = lambda symbol: seen.append(
+            (clock.now(), get_analytics_writer_override())) or []
+        writer = Mock()
+        previous = set_analytics_writer(writer)
+        try:
+            with clock.frozen(datetime(2026, 8, 3, 15, 45)):
+                scanner.scan_for_put_opportunities()
+        finally:
+            set_analytics_writer(previous)
+
+        assert seen == [(datetime(2026, 8, 3, 15, 45), writer)] * 4
+
+    @pytest.mark.real_finnhub_fetch
+    def test_the_real_earnings_gate_stays_on_the_calling_thread(self):
+        """The real calendar (fake Finnhub, no network) under an 8-way scan:
+        every cache, Finnhub and L2 touch happens on the scanning thread, a
+        failed fetch fails closed exactly as it would sequentially, and only
+        the chain fetches land on pool threads."""
+        from src.api.earnings_calendar import EarningsCalendarService
+
+        caller = threading.get_ident()
+        gate_threads, l2_threads, chain_threads = set(), [], set()
+
+        class Finnhub:
+            def earnings_calendar(self, **kwargs):
+                gate_threads.add(threading.get_ident())
+                if kwargs['symbol'] == 'MSFT':
+                    raise RuntimeError('finnhub down')
+                return {'earningsCalendar': []}
+
+        calendar_config = Mock()
+        calendar_config.finnhub_api_key = 'test_finnhub_key'
+        calendar_config.earnings_enabled = True
+        calendar_config.opportunity_bucket = 'test-bucket'
+        calendar = EarningsCalendarService(calendar_config)
+        calendar._client = Finnhub()
+
+        scanner, market_data = self._scanner(8)
+        scanner.earnings_calendar = calendar
+        scanner.config.earnings_blackout_days = 2
+        fetch = market_data.find_suitable_puts.side_effect
+
+        def find_suitable_puts(symbol):
+            chain_threads.add(threading.get_ident())
+            return fetch(symbol)
+        market_data.find_suitable_puts.side_effect = find_suitable_puts
+
+        record = lambda self: l2_threads.append(threading.get_ident())
+        with patch.object(EarningsCalendarService, '_l2_read', record), \
+                patch.object(EarningsCalendarService, '_store_to_l2', record), \
+                clock.frozen(datetime(2025, 1, 10, 15, 45)):
+            got = scanner.scan_for_put_opportunities(max_results=20)
+
+        assert {o['symbol'] for o in got} == {'AAPL', 'GOOGL', 'NVDA'}
+        assert gate_threads == {caller}
+        assert l2_threads and set(l2_threads) == {caller}
+        assert caller not in chain_threads
+
+
 class TestOptionsScannerScanAll:
     """Test OptionsScanner.scan_all_opportunities."""
 
@@ -888,6 +999,26 @@ class TestOptionsScannerScanAll:
         assert 'scan_timestamp' in result
         assert 'total_opportunities' in result
 
+    def test_legs_run_in_order_on_the_calling_thread(self):
+        """Puts then calls, both here: the legs share the earnings calendar's
+        single-caller cache and the stage-1 quote/bar batch."""
+        seen = []
+
+        def leg(name, result):
+            def scan(max_results):
+                seen.append((name, threading.get_ident()))
+                return result
+            return scan
+
+        self.scanner.scan_for_put_opportunities = leg('puts', [{'symbol': 'AAPL'}])
+        self.scanner.scan_for_call_opportunities = leg('calls', [])
+
+        result = self.scanner.scan_all_opportunities()
+
+        assert result['puts'] == [{'symbol': 'AAPL'}]
+        me = threading.get_ident()
+        assert seen == [('puts', me), ('calls', me)]
+
     def test_scan_all_handles_exception(self):
         """Test graceful error handling in scan_all."""
         self.mock_market_data.filter_suitable_stocks.side_effect = Exception("Timeout")
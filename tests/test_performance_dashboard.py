@@ -0,0 +1,259 @@
+"""Performance dashboard (``deploy/monitoring/performance_dashboard.py``).
+
+The dashboard feeds the ``/dashboard*`` endpoints. Its scoring, grading and
+alerting rules are pinned here so the hot-path rewrites can be checked
+against the original behaviour.
+"""
+
+import json
+import sys
+from datetime import datetime
+from dataclasses import asdict, replace
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from deploy.monitoring import performance_dashboard as pd_mod  # noqa: E402
+from deploy.monitoring.performance_dashboard import (  # noqa: E402
+    PerformanceMetrics,
+    PerformanceMonitor,
+)
+
+
+def _metrics(**overrides) -> PerformanceMetrics:
+    base = PerformanceMetrics(
+        timestamp="2026-01-05T10:00:00",
+        total_return=0.045,
+        daily_pnl=0.0,
+        portfolio_value=100000.0,
+        cash_allocation=0.22,
+        positions_count=8,
+        win_rate=0.75,
+        avg_return_per_trade=0.023,
+        max_drawdown=-0.018,
+        sharpe_ratio=1.85,
+        volatility=0.12,
+        var_95=-0.015,
+        gap_events=1,
+        trades_blocked=0,
+        api_errors=0,
+        execution_latency=1.2,
+    )
+    return replace(base, **overrides)
+
+
+@pytest.fixture
+def monitor(monkeypatch):
+    monkeypatch.setattr(pd_mod, "GOOGLE_CLOUD_AVAILABLE", False)
+    return PerformanceMonitor()
+
+
+class TestMetricsRecords:
+    def test_metrics_are_immutable(self):
+        with pytest.raises(AttributeError):
+            _metrics().win_rate = 0.5
+
+    def test_dict_form_matches_asdict(self):
+        m = _metrics(api_errors=3)
+        assert pd_mod._pm_to_dict(m) == asdict(m)
+        assert list(pd_mod._pm_to_dict(m)) == list(asdict(m))
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need 3.10+")
+    def test_metrics_are_slotted(self):
+        assert not hasattr(_metrics(), "__dict__")
+
+
+class TestCloudClientsAreLazy:
+    def test_constructor_creates_no_clients(self, monkeypatch):
+        factory = Mock()
+        monkeypatch.setattr(pd_mod, "GOOGLE_CLOUD_AVAILABLE", True)
+        monkeypatch.setattr(pd_mod, "monitoring_v3", Mock(MetricServiceClient=factory))
+        monitor = PerformanceMonitor()
+        monitor.generate_dashboard_data()
+        factory.assert_not_called()
+
+        assert monitor.monitoring_client is factory.return_value
+        assert monitor.monitoring_client is factory.return_value
+        factory.assert_called_once()
+
+    def test_failed_init_yields_none(self, monkeypatch):
+        monkeypatch.setattr(pd_mod, "GOOGLE_CLOUD_AVAILABLE", True)
+        monkeypatch.setattr(pd_mod, "cloud_logging", Mock(Client=Mock(side_effect=RuntimeError("no creds"))))
+        assert PerformanceMonitor().logging_client is None
+
+    def test_unavailable_sdk_yields_none(self, monitor):
+        assert monitor.monitoring_client is None
+        assert monitor.logging_client is None
+
+
+class TestExecutionScore:
+    @pytest.mark.parametrize("latency,errors,blocked,expected", [
+        (1.2, 0, 0, 100.0),
+        (2.0, 0, 0, 100.0),
+        (3.5, 0, 0, 85.0),
+        (10.0, 0, 0, 70.0),      # latency penalty caps at 30
+        (1.0, 2, 1, 87.0),
+        (1.0, 50, 0, 80.0),      # API-error penalty caps at 20
+        (1.0, 0, 9, 85.0),       # blocked-trade penalty caps at 15
+        (99.0, 99, 99, 35.0),
+    ])
+    def test_penalties(self, monitor, latency, errors, blocked, expected):
+        m = _metrics(execution_latency=latency, api_errors=errors, trades_blocked=blocked)
+        assert monitor._calculate_execution_score(m) == pytest.approx(expected)
+
+
+class TestPerformanceGrade:
+    @pytest.mark.parametrize("total_return,drawdown,win_rate,grade", [
+        (0.06, -0.01, 0.85, "A"),    # 40 + 30 + 30
+        (0.045, -0.018, 0.75, "B"),  # 30 + 30 + 20 (0.75 is not > 0.75)
+        (0.05, -0.02, 0.80, "B"),    # boundaries are strict: 30 + 25 + 25
+        (0.02, -0.04, 0.70, "F"),    # 20 + 15 + 15
+        (0.0, -0.10, 0.50, "F"),     # 0 + 0 + 5
+        (0.04, -0.025, 0.72, "C"),   # 30 + 25 + 20
+        (0.02, -0.025, 0.72, "D"),   # 20 + 25 + 20 = 65
+    ])
+    def test_grade(self, monitor, total_return, drawdown, win_rate, grade):
+        m = _metrics(total_return=total_return, max_drawdown=drawdown, win_rate=win_rate)
+        assert monitor._calculate_performance_grade(m) == grade
+
+    def test_matches_staircase_on_every_boundary(self, monitor):
+        def staircase(ret, dd, wr):
+            score = 0
+            score += 40 if ret > 0.05 else 30 if ret > 0.03 else 20 if ret > 0.01 else 10 if ret > 0 else 0
+            score += 30 if dd > -0.02 else 25 if dd > -0.03 else 15 if dd > -0.05 else 5 if dd > -0.08 else 0
+            score += 30 if wr > 0.80 else 25 if wr > 0.75 else 20 if wr > 0.70 else 15 if wr > 0.65 else 5
+            return "A" if score >= 90 else "B" if score >= 80 else "C" if score >= 70 else "D" if score >= 60 else "F"
+
+        eps = 1e-9
+        returns = [r + d for r in (0.0, 0.01, 0.03, 0.05) for d in (-eps, 0.0, eps)]
+        drawdowns = [r + d for r in (-0.08, -0.05, -0.03, -0.02) for d in (-eps, 0.0, eps)]
+        win_rates = [r + d for r in (0.65, 0.70, 0.75, 0.80) for d in (-eps, 0.0, eps)]
+        for ret in returns:
+            for dd in drawdowns:
+                for wr in win_rates:
+                    m = _metrics(total_return=ret, max_drawdown=dd, win_rate=wr)
+                    assert monitor._calculate_performance_grade(m) == staircase(ret, dd, wr)
+
+
+class TestAlerts:
+    def test_healthy_metrics_raise_nothing(self, monitor):
+        assert monitor.check_alerts(_metrics()) == []
+
+    def test_every_rule_fires(self, monitor):
+        m = _metrics(
+            daily_pnl=-5000.0, cash_allocation=0.05, max_drawdown=-0.09,
+            api_errors=9, execution_latency=7.5, win_rate=0.40, gap_events=5,
+        )
+        alerts = monitor.check_alerts(m)
+        assert [a["type"] for a in alerts] == [
+            "daily_loss", "low_cash", "max_drawdown", "api_errors",
+            "execution_latency", "low_win_rate", "gap_events",
+        ]
+        by_type = {a["type"]: a for a in alerts}
+        assert by_type["daily_loss"]["threshold"] == pytest.approx(-2000.0)
+        assert by_type["daily_loss"]["message"] == "Daily loss -5000.00 exceeds threshold"
+        assert by_type["low_cash"]["message"] == "Cash allocation 5.0% below minimum"
+        assert by_type["execution_latency"]["severity"] == "low"
+        assert all(a["timestamp"] == m.timestamp for a in alerts)
+
+    def test_one_log_event_per_check(self, monitor, monkeypatch):
+        log = Mock()
+        monkeypatch.setattr(monitor, "_log", log)
+        monitor.check_alerts(_metrics())
+        log.warning.assert_not_called()
+
+        monitor.check_alerts(_metrics(cash_allocation=0.05, gap_events=5))
+        log.warning.assert_called_once()
+        kwargs = log.warning.call_args.kwargs
+        assert kwargs["event_type"] == "alerts_triggered"
+        assert kwargs["alert_count"] == 2
+        assert kwargs["alert_types"] == ["low_cash", "gap_events"]
+
+    def test_high_severity_alert_degrades_system_health(self, monitor):
+        assert monitor._check_system_health()["overall_status"] == "healthy"
+        monitor.check_alerts(_metrics(max_drawdown=-0.09))
+        health = monitor._check_system_health()
+        assert health["overall_status"] == "degraded"
+        assert health["components"]["risk_management"] == "warning"
+
+    def test_high_alert_ages_out_after_ten_newer_alerts(self, monitor):
+        monitor.check_alerts(_metrics(max_drawdown=-0.09))
+        for _ in range(9):
+            monitor.check_alerts(_metrics(win_rate=0.40))
+        assert monitor._check_system_health()["overall_status"] == "degraded"
+        monitor.check_alerts(_metrics(win_rate=0.40))
+        assert monitor._check_system_health()["overall_status"] == "healthy"
+
+
+class TestDashboard:
+    def test_dashboard_sections(self, monitor):
+        data = monitor.generate_dashboard_data()
+        assert set(data) >= {
+            "current_metrics", "alerts", "trends", "performance_summary",
+            "system_health", "risk_metrics", "execution_metrics", "timestamp",
+        }
+        assert data["current_metrics"]["positions_count"] == 8
+        assert data["trends"] == {"trend_data": "insufficient_data"}
+
+    def test_trends_after_two_samples(self, monitor):
+        monitor.collect_current_metrics()
+        data = monitor.generate_dashboard_data()
+        assert data["trends"]["positions_count"]["change"] == 0
+
+    def test_csv_export(self, monitor):
+        lines = monitor.export_metrics("csv").splitlines()
+        assert lines[0] == (
+            "timestamp,portfolio_value,total_return,daily_pnl,"
+            "win_rate,max_drawdown,sharpe_ratio,positions_count"
+        )
+        assert len(lines) == 2
+        assert lines[1].endswith(",8")
+
+    def test_one_timestamp_per_tick(self, monitor):
+        data = monitor.generate_dashboard_data()
+        ts = data["current_metrics"]["timestamp"]
+        assert data["timestamp"] == ts
+        assert data["system_health"]["last_health_check"] == ts
+
+    def test_mock_variation_is_stable_per_day(self, monitor):
+        a = monitor.collect_current_metrics(datetime(2026, 3, 2, 9, 30))
+        b = monitor.collect_current_metrics(datetime(2026, 3, 2, 15, 45))
+        c = monitor.collect_current_metrics(datetime(2026, 3, 3, 9, 30))
+        assert a.portfolio_value == b.portfolio_value
+        assert abs(a.total_return - 0.045) <= 0.005
+        assert a.portfolio_value != c.portfolio_value
+
+    def test_csv_export_skips_alert_bookkeeping(self, monitor, monkeypatch):
+        check = Mock(return_value=[])
+        monkeypatch.setattr(monitor, "check_alerts", check)
+        monitor.export_metrics("csv")
+        check.assert_not_called()
+        monitor.export_metrics("json")
+        check.assert_called_once()
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_export_round_trips(self, monitor, monkeypatch, use_orjson):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(pd_mod, "ORJSON_AVAILABLE", use_orjson)
+        data = json.loads(monitor.export_metrics("json"))
+        assert data["current_metrics"]["positions_count"] == 8
+        assert data["alerts"]["alert_count"] == 0
+
+
+class TestHistoryIsBounded:
+    def test_metrics_history_keeps_the_newest_1000(self, monitor):
+        for _ in range(1005):
+            monitor.collect_current_metrics()
+        assert len(monitor.metrics_history) == 1000
+
+    def test_alerts_history_keeps_the_newest_500(self, monitor):
+        for i in range(260):
+            monitor.check_alerts(_metrics(max_drawdown=-0.09, win_rate=0.40, timestamp=str(i)))
+        assert len(monitor.alerts_history) == 500
+        assert monitor.alerts_history[-1]["timestamp"] == "259"
+        recent = monitor.generate_dashboard_data()["alerts"]["recent_alerts"]
+        assert len(recent) == 10
@@ -0,0 +1,134 @@
+"""Tests for the CLI portfolio tracker (``status`` / ``report`` commands)."""
+
+import math
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from src.data.portfolio_tracker import PortfolioTracker
+from src.utils.config import Config
+
+
+def _position(symbol, asset_class, qty, market_value, unrealized_pl):
+    return {
+        'symbol': symbol,
+        'asset_class': asset_class,
+        'qty': str(qty),
+        'market_value': str(market_value),
+        'unrealized_pl': str(unrealized_pl),
+    }
+
+
+POSITIONS = [
+    _position('AAPL', 'us_equity', 100, 17500.0, 250.0),
+    _position('AAPL_250117C00180000', 'us_option', -1, -120.0, 35.0),
+    _position('MSFT_250117P00380000', 'us_option', -2, -300.0, 80.0),
+    _position('TSLA', 'us_equity', -10, -2500.0, -40.0),  # short stock
+    _position('AMD', 'us_equity', 50, 7000.0, -125.5),
+]
+
+
+class TestPortfolioSnapshot:
+
+    def setup_method(self):
+        self.alpaca = Mock()
+        self.alpaca.get_account.return_value = {
+            'portfolio_value': '100000', 'cash': '40000',
+            'buying_power': '80000', 'equity': '100000',
+        }
+        self.alpaca.get_positions.return_value = POSITIONS
+        self.tracker = PortfolioTracker(self.alpaca, Mock(spec=Config))
+
+    def test_position_totals(self):
+        snap = self.tracker.get_current_portfolio_snapshot()
+        positions = snap['positions']
+        assert positions['total_count'] == 5
+        # short stock is not a stock position for the wheel
+        assert positions['stock_positions'] == 2
+        assert positions['stock_value'] == pytest.approx(24500.0)
+        assert positions['option_positions'] == 2
+        assert positions['option_value'] == pytest.approx(-420.0)
+        assert positions['total_value'] == pytest.approx(24080.0)
+        # ... but its P&L still counts
+        assert snap['performance']['total_unrealized_pl'] == pytest.approx(199.5)
+        assert snap['performance']['unrealized_pl_percent'] == pytest.approx(0.1995)
+
+    def test_grouping_and_wheel_stages(self):
+        snap = self.tracker.get_current_portfolio_snapshot()
+        groups = snap['underlying_positions']
+        assert set(groups) == {'AAPL', 'MSFT', 'TSLA', 'AMD'}
+        assert groups['AAPL']['wheel_stage'] == 'covered_calls'
+        assert groups['AAPL']['total_value'] == pytest.approx(17380.0)
+        assert groups['AAPL']['total_pl'] == pytest.approx(285.0)
+        assert len(groups['AAPL']['option_positions']) == 1
+        assert groups['MSFT']['wheel_stage'] == 'cash_secured_puts'
+        assert groups['AMD']['wheel_stage'] == 'assigned_stock'
+
+        wheel = snap['wheel_metrics']
+        assert wheel['active_wheels'] == 4
+        assert (wheel['cash_secured_puts'], wheel['assigned_stocks'], wheel['covered_calls']) == (1, 2, 1)
+
+    def test_empty_account(self):
+        self.alpaca.get_positions.return_value = []
+        snap = self.tracker.get_current_portfolio_snapshot()
+        assert snap['positions']['total_count'] == 0
+        assert snap['positions']['total_value'] == 0
+        assert snap['underlying_positions'] == {}
+
+    def test_api_failure_returns_error(self):
+        self.alpaca.get_account.side_effect = RuntimeError("boom")
+        assert self.tracker.get_current_portfolio_snapshot() == {'error': 'boom'}
+
+
+def _history(values):
+    start = datetime.now() - timedelta(days=len(values))
+    return [
+        {'timestamp': (start + timedelta(days=i)).isoformat(),
+         'account': {'portfolio_value': v}}
+        for i, v in enumerate(values)
+    ]
+
+
+class TestPerformanceMetrics:
+
+    VALUES = [100000, 101000, 99500, 99000, 102000, 101500,
+              103000, 98000, 100500, 104000, 103500, 105000]
+
+    def setup_method(self):
+        self.tracker = PortfolioTracker(Mock(), Mock(spec=Config))
+
+    def test_matches_loop_definitions(self):
+        self.tracker._performance_history = _history(self.VALUES)
+        m = self.tracker.calculate_performance_metrics()
+
+        returns = [(b - a) / a for a, b in zip(self.VALUES, self.VALUES[1:])]
+        mean = sum(returns) / len(returns)
+        vol = math.sqrt(sum((r - mean) ** 2 for r in returns) / len(returns)) * math.sqrt(365)
+        assert m['volatility_percent'] == pytest.approx(vol * 100)
+        assert m['sharpe_ratio'] == pytest.approx(
+            (m['annualized_return_percent'] / 100 - 0.05) / vol)
+
+        peak, worst = self.VALUES[0], 0.0
+        for v in self.VALUES:
+            peak = max(peak, v)
+            worst = max(worst, (peak - v) / peak * 100)
+        assert m['max_drawdown_percent'] == pytest.approx(worst)
+        assert m['data_points'] == len(self.VALUES)
+
+    def test_short_window_skips_volatility(self):
+        self.tracker._performance_history = _history([100000, 95000, 97000])
+        m = self.tracker.calculate_performance_metrics()
+        assert (m['volatility_percent'], m['sharpe_ratio']) == (0, 0)
+        assert m['max_drawdown_percent'] == pytest.approx(5.0)
+
+    def test_monotonic_rise_has_no_drawdown(self):
+        self.tracker._performance_history = _history(list(np.linspace(1e5, 1.1e5, 12)))
+        assert self.tracker.calculate_performance_metrics()['max_drawdown_percent'] == 0
+
+    def test_zero_values_are_skipped(self):
+        self.tracker._performance_history = _history([0.0] * 3 + [100.0] * 9)
+        m = self.tracker.calculate_performance_metrics()
+        assert m['volatility_percent'] == 0
+        assert m['max_drawdown_percent'] == 0
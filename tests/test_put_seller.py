@@ -106,6 +106,21 @@ class TestPutSellerPositionSizing:
         assert result is not None
         assert result['contracts'] == 1
 
+    def test_position_size_with_a_supplied_account_snapshot(self):
+        """A caller's account snapshot is used as-is; no account read."""
+        put_option = {
+            'symbol': 'AAPL250117P00080000',
+            'strike_price': 80.0,
+            'mid_price': 2.00,
+        }
+
+        result = self.put_seller._calculate_position_size(
+            put_option, override_buying_power=20000.0,
+            account_info={'portfolio_value': 100000.0})
+        assert result is not None
+        assert result['contracts'] == 1
+        self.mock_alpaca.get_account.assert_not_called()
+
     def test_position_size_api_error(self):
         """Test returns None when account API fails."""
         self.mock_alpaca.get_account.side_effect = Exception("API Error")
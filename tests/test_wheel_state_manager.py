@@ -22,7 +22,7 @@ from datetime import datetime, timedelta
 import pytest
 
 import src.strategy.wheel_state_manager as wsm_module
-from src.strategy.wheel_state_manager import WheelStateManager, WheelPhase
+from src.strategy.wheel_state_manager import WheelStateManager, WheelPhase, new_symbol_state
 
 
 class TestPutAssignment:
@@ -379,6 +379,13 @@ class TestTheShrinkCensus:
         assert not hasattr(manager, 'wheel_cycles')
         assert vars(manager) == {'symbol_states': {}}
 
+    def test_both_writers_seed_the_same_complete_entry(self):
+        """Readers index the keys directly, so a put-assigned entry and a
+        reconciliation-seeded one must carry the same key set."""
+        manager = WheelStateManager()
+        manager.handle_put_assignment("TEST", 100, 100.0, datetime(2024, 1, 15))
+        assert set(manager.symbol_states["TEST"]) == set(new_symbol_state())
+
     def test_state_entries_carry_no_premium_accumulators(self):
         """Their only writers are deleted, so any surviving key would be a
         permanent 0.0 masquerading as a measurement — the exact failure mode